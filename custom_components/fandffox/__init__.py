@@ -2,8 +2,13 @@
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Callable, Iterable, Mapping
 from datetime import timedelta
+from functools import partial
+from importlib import import_module
 import logging
+import time
+from typing import Any
 
 from foxrestapiclient.devices.const import (
     DEVICE_MODEL_DIM1S2,
@@ -20,19 +25,54 @@ from foxrestapiclient.devices.const import (
     SUPPORTED_PLATFORM_SENSOR,
     SUPPORTED_PLATFORM_SWITCH,
 )
-from foxrestapiclient.devices.fox_base_device import DeviceData
-from foxrestapiclient.devices.fox_dim1s2_device import FoxDIM1S2Device
-from foxrestapiclient.devices.fox_led2s2_device import FoxLED2S2Device
-from foxrestapiclient.devices.fox_r1s1_device import FoxR1S1Device
-from foxrestapiclient.devices.fox_r2s2_device import FoxR2S2Device
-from foxrestapiclient.devices.fox_rgbw_device import FoxRGBWDevice
-from foxrestapiclient.devices.fox_str1s2_device import FoxSTR1S2Device
-
-from .const import DOMAIN
+from foxrestapiclient.devices.fox_base_device import DeviceData, FoxBaseDevice
+
+from .const import (
+    CHANNEL_BATCH_WINDOW,
+    DEFAULT_BACKGROUND_POOLING,
+    DEFAULT_CONNECT_TIMEOUT,
+    DEFAULT_COORDINATOR_TIMEOUT,
+    DEFAULT_REQUEST_RETRIES,
+    DEFAULT_REQUEST_TIMEOUT,
+    DEFAULT_STALE_GRACE,
+    DEFAULT_STALL_THRESHOLD,
+    DEVICE_INFO_REFRESH_INTERVAL,
+    DEVICE_PORT,
+    DEVICE_PROBE_INTERVAL,
+    DOMAIN,
+    SCHEMA_INPUT_BACKGROUND_POOLING,
+    SCHEMA_INPUT_CONNECT_TIMEOUT,
+    SCHEMA_INPUT_POLL_DEADLINE,
+    SCHEMA_INPUT_REQUEST_RETRIES,
+    SCHEMA_INPUT_REQUEST_TIMEOUT,
+    SCHEMA_INPUT_STALE_GRACE,
+    SCHEMA_INPUT_STALL_THRESHOLD,
+)
+from .capture import (
+    async_register_capture_services,
+    async_remove_capture_services,
+    device_state,
+    job_name,
+)
+from .discovery import FoxDeviceTracker, async_probe_host
+from .profiling import SERVICE_PROFILE, async_register_profile_service
+from .snapshot import SERVICE_SNAPSHOT, async_register_snapshot_api
+from .scheduler import (
+    PRIORITY_COMMAND,
+    PRIORITY_CONFIRM,
+    PRIORITY_INFO,
+    PRIORITY_POLL,
+    RETRY_ERRORS,
+    FoxDeviceQueue,
+    async_call_with_retry,
+)
+from .watch import async_remove_watchers, async_setup_watchers
+from .watchdog import SECTION_COORDINATOR_UPDATE, SECTION_DEVICE_REQUEST, FoxStallWatchdog
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import Event, HomeAssistant, callback
 from homeassistant.const import Platform
-from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers import device_registry as dr, entity_registry as er
+from homeassistant.helpers.event import async_track_time_interval
 from homeassistant.util import Throttle
 
 _LOGGER = logging.getLogger(__name__)
@@ -40,6 +80,52 @@ _LOGGER.propagate = False
 THROTTLE_TIME = timedelta(seconds=1)
 # Supported platforms.
 PLATFORMS = [Platform.COVER, Platform.LIGHT, Platform.SWITCH, Platform.SENSOR]
+# Device classes by model, as (module, class name). Modules are imported
+# only when the first device of given model is configured.
+DEVICE_FACTORIES: dict[str, tuple[str, str]] = {
+    DEVICE_MODEL_DIM1S2: (
+        "foxrestapiclient.devices.fox_dim1s2_device", "FoxDIM1S2Device"
+    ),
+    DEVICE_MODEL_LED2S2: (
+        "foxrestapiclient.devices.fox_led2s2_device", "FoxLED2S2Device"
+    ),
+    DEVICE_MODEL_R1S1: (
+        "foxrestapiclient.devices.fox_r1s1_device", "FoxR1S1Device"
+    ),
+    DEVICE_MODEL_R2S2: (
+        "foxrestapiclient.devices.fox_r2s2_device", "FoxR2S2Device"
+    ),
+    DEVICE_MODEL_RGBW: (
+        "foxrestapiclient.devices.fox_rgbw_device", "FoxRGBWDevice"
+    ),
+    DEVICE_MODEL_STR1S2: (
+        "foxrestapiclient.devices.fox_str1s2_device", "FoxSTR1S2Device"
+    ),
+}
+_DEVICE_CLASSES: dict[str, type[FoxBaseDevice]] = {}
+
+
+def register_device_factory(model: str, module: str, class_name: str) -> None:
+    """Register device class used for given device model."""
+    DEVICE_FACTORIES[model] = (module, class_name)
+    _DEVICE_CLASSES.pop(model, None)
+
+
+def get_device_class(model: str) -> type[FoxBaseDevice]:
+    """Return device class for given model, importing it on first use."""
+    device_class = _DEVICE_CLASSES.get(model)
+    if device_class is None:
+        module, class_name = DEVICE_FACTORIES[model]
+        device_class = getattr(import_module(module), class_name)
+        _DEVICE_CLASSES[model] = device_class
+    return device_class
+
+
+def load_device_classes(models: Iterable[str]) -> None:
+    """Import device classes for given models (blocking)."""
+    for model in models:
+        if model in DEVICE_FACTORIES:
+            get_device_class(model)
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
@@ -47,11 +133,40 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     hass.data.setdefault(DOMAIN, {})
     #Set update callback
     entry.async_on_unload(entry.add_update_listener(update_listener))
-    fox_devices_coordinator = FoxDevicesCoordinator()
+    fox_devices_coordinator = FoxDevicesCoordinator(entry.options)
     hass.data[DOMAIN][entry.entry_id] = fox_devices_coordinator
-    for device_config in entry.data["discovered_devices"]:
-        fox_devices_coordinator.add_device_by_config(DeviceData(**device_config))
+    device_configs = [
+        DeviceData(**device_config) for device_config in entry.data["discovered_devices"]
+    ]
+    # Import only device modules needed by this entry, outside event loop.
+    await hass.async_add_executor_job(
+        load_device_classes,
+        {DEVICES[config.dev_type] for config in device_configs if config.dev_type in DEVICES},
+    )
+    for device_config in device_configs:
+        fox_devices_coordinator.add_device_by_config(device_config)
+    tracker = FoxDeviceTracker(hass, entry, fox_devices_coordinator)
+    entry.async_on_unload(tracker.async_start())
+    entry.async_on_unload(
+        async_track_time_interval(
+            hass,
+            fox_devices_coordinator.async_probe_unreachable,
+            timedelta(seconds=DEVICE_PROBE_INTERVAL),
+        )
+    )
+    # Static info comes with first poll of platforms, then it is refreshed
+    # in background while routine polls fetch only device state.
+    fox_devices_coordinator.on_device_info_updated = partial(
+        _async_update_device_registry, hass
+    )
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    async_register_profile_service(hass)
+    async_register_capture_services(hass)
+    async_register_snapshot_api(hass)
+    entry.async_on_unload(
+        _async_track_entity_usage(hass, entry, fox_devices_coordinator)
+    )
+    async_setup_watchers(hass).async_update()
     area_id = entry.data.get("area_id")
     if area_id:
         await _assign_area_to_devices(hass, fox_devices_coordinator, area_id)
@@ -62,19 +177,54 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id)
+        hass.data[DOMAIN].pop(entry.entry_id).shutdown()
+        if not hass.data[DOMAIN]:
+            hass.services.async_remove(DOMAIN, SERVICE_PROFILE)
+            async_remove_capture_services(hass)
+            hass.services.async_remove(DOMAIN, SERVICE_SNAPSHOT)
+            async_remove_watchers(hass)
 
     return unload_ok
 
 async def update_listener(hass, entry):
     """Handle options update."""
+    coordinator = hass.data[DOMAIN].get(entry.entry_id)
+    if coordinator is not None and coordinator.options == entry.options:
+        # Only device data changed (e.g. tracked device host), keep running.
+        return
     await hass.config_entries.async_reload(entry.entry_id)
 
 class FoxDevicesCoordinator:
     """Fox devices coordinator."""
 
-    def __init__(self) -> None:
+    def __init__(self, options=None) -> None:
         """Store devices as map agregated by platform."""
+        self.options = dict(options or {})
+        self.request_timeout = float(
+            self.options.get(SCHEMA_INPUT_REQUEST_TIMEOUT, DEFAULT_REQUEST_TIMEOUT)
+        )
+        self.request_retries = int(
+            self.options.get(SCHEMA_INPUT_REQUEST_RETRIES, DEFAULT_REQUEST_RETRIES)
+        )
+        self.poll_deadline = float(
+            self.options.get(SCHEMA_INPUT_POLL_DEADLINE, DEFAULT_COORDINATOR_TIMEOUT)
+        )
+        self.connect_timeout = float(
+            self.options.get(SCHEMA_INPUT_CONNECT_TIMEOUT, DEFAULT_CONNECT_TIMEOUT)
+        )
+        self.stale_grace = float(
+            self.options.get(SCHEMA_INPUT_STALE_GRACE, DEFAULT_STALE_GRACE)
+        )
+        self.background_pooling = float(
+            self.options.get(SCHEMA_INPUT_BACKGROUND_POOLING, DEFAULT_BACKGROUND_POOLING)
+        )
+        self.watchdog = FoxStallWatchdog(
+            self.options.get(SCHEMA_INPUT_STALL_THRESHOLD, DEFAULT_STALL_THRESHOLD) / 1000
+        )
+        # Capture or replay of device traffic, when running.
+        self.traffic = None
+        # Called with device, when device becomes unavailable.
+        self.on_device_unavailable: Callable[[FoxBaseDevice], None] | None = None
         self.__devices_map: dict[str, list] = {
             SUPPORTED_PLATFORM_COVER: [],
             SUPPORTED_PLATFORM_GATE: [],
@@ -82,6 +232,32 @@ class FoxDevicesCoordinator:
             SUPPORTED_PLATFORM_SENSOR: [],
             SUPPORTED_PLATFORM_SWITCH: [],
         }
+        self.__device_models: dict[str, str] = {}
+        self.__device_configs: dict[str, DeviceData] = {}
+        self.__available: dict[str, bool] = {}
+        # Devices which failed to answer, skipped by polls until probed.
+        self.__unreachable: set[str] = set()
+        # Time of last good state of devices, served during stale grace.
+        self.__last_good: dict[str, float] = {}
+        self.__revalidating: dict[str, asyncio.Task] = {}
+        self.__queues: dict[str, FoxDeviceQueue] = {}
+        # Devices with all entities disabled, left out of polls.
+        self.__idle: set[str] = set()
+        # Devices with watched entities, None until watchers report them.
+        self.__watched: set[str] | None = None
+        # Time of last started poll by device.
+        self.__last_polled: dict[str, float] = {}
+        # Channel states collected by device, with future of their delivery.
+        self.__channel_batches: dict[str, tuple[dict, asyncio.Future]] = {}
+        # Time of last static device info fetch, missing when it is due.
+        self.__info_fetched: dict[str, float] = {}
+        self.__info_tasks: set[asyncio.Task] = set()
+        # Called with device, when its static info was refreshed.
+        self.on_device_info_updated: Callable[[FoxBaseDevice], None] | None = None
+        # Entity callbacks by device, called when its static info was refreshed.
+        self.__info_listeners: dict[str, list[Callable[[], None]]] = {}
+        # Time (in seconds) of last answered request by device.
+        self.__latency: dict[str, float] = {}
 
     def add_device_by_config(self, device_data: DeviceData):
         """Add device to map with proper platform."""
@@ -89,62 +265,401 @@ class FoxDevicesCoordinator:
         if device_data.skip is True:
             return
         try:
-            if DEVICES[device_data.dev_type] == DEVICE_MODEL_LED2S2:
-                self.__devices_map[DEVICE_PLATFORM[device_data.dev_type]].append(
-                    FoxLED2S2Device(device_data)
-                )
-            elif DEVICES[device_data.dev_type] == DEVICE_MODEL_DIM1S2:
-                self.__devices_map[DEVICE_PLATFORM[device_data.dev_type]].append(
-                    FoxDIM1S2Device(device_data)
-                )
-            elif DEVICES[device_data.dev_type] == DEVICE_MODEL_RGBW:
-                self.__devices_map[DEVICE_PLATFORM[device_data.dev_type]].append(
-                    FoxRGBWDevice(device_data)
-                )
-            elif DEVICES[device_data.dev_type] == DEVICE_MODEL_R1S1:
-                self.__devices_map[DEVICE_PLATFORM[device_data.dev_type]].append(
-                    FoxR1S1Device(device_data)
+            model = DEVICES[device_data.dev_type]
+            platform = DEVICE_PLATFORM[device_data.dev_type]
+            device = get_device_class(model)(device_data)
+            self.__devices_map[platform].append(device)
+        except KeyError:
+            # Library knows some models (e.g. GATE) without any device class
+            # or platform, such devices cannot be controlled.
+            _LOGGER.error(
+                "Unsupported F&F Fox device type %s (%s).",
+                device_data.dev_type,
+                DEVICES.get(device_data.dev_type, "unknown model"),
+            )
+            return
+        self.__device_models[device.mac_addr] = model
+        self.__device_configs[device.mac_addr] = device_data
+        self.__queues[device.mac_addr] = FoxDeviceQueue(device.mac_addr)
+
+    def shutdown(self):
+        """Cancel all pending device requests."""
+        for queue in self.__queues.values():
+            queue.cancel()
+        for task in self.__revalidating.values():
+            task.cancel()
+        for task in self.__info_tasks:
+            task.cancel()
+
+    def _submit(self, device: FoxBaseDevice, priority: int, job) -> asyncio.Future:
+        """Queue device request limited by timeout and retry budget."""
+        traffic = self.traffic
+        # Polls are merged only with queued polls of the same device method.
+        name = job_name(job)
+        if traffic is not None:
+            job = partial(traffic.async_call, device, job, priority)
+        job = partial(self._async_timed, device, job)
+        if self.watchdog.enabled:
+            job = partial(
+                self.watchdog.async_measure_steps,
+                SECTION_DEVICE_REQUEST,
+                device.mac_addr,
+                job,
+            )
+        future = self.__queues[device.mac_addr].submit(
+            priority,
+            partial(
+                async_call_with_retry, job, self.request_timeout, self.request_retries
+            ),
+            name,
+        )
+        if traffic is not None:
+            traffic.track(device, name, future)
+        return future
+
+    def submit_request(
+        self, device: FoxBaseDevice, priority: int, job
+    ) -> asyncio.Future:
+        """Queue any device request, used to replay captured traffic."""
+        return self._submit(device, priority, job)
+
+    async def _async_timed(self, device: FoxBaseDevice, job):
+        """Call device, storing time it took to answer."""
+        started = time.monotonic()
+        result = await job()
+        self.__latency[device.mac_addr] = time.monotonic() - started
+        return result
+
+    async def async_prepare_devices(self, devices: list[FoxBaseDevice]):
+        """Make devices ready to start commands at once.
+
+        Queued polls are dropped and requests in progress are awaited, so
+        following commands are not held behind them.
+        """
+        await asyncio.gather(
+            *(self.__queues[device.mac_addr].async_wait_idle() for device in devices)
+        )
+
+    async def async_send_command(self, device: FoxBaseDevice, command, *args):
+        """Send command to device ahead of any queued polls."""
+        return await self._submit(device, PRIORITY_COMMAND, partial(command, *args))
+
+    async def async_confirm_device(self, device: FoxBaseDevice):
+        """Read device state after command, ahead of routine polls."""
+        try:
+            await self._submit(device, PRIORITY_CONFIRM, device.async_fetch_update)
+        except RETRY_ERRORS:
+            self._update_availability(device, failed=True)
+            raise
+        self._update_availability(device)
+
+    async def async_set_channel_state(
+        self, device: FoxBaseDevice, channel: int | None, state: bool
+    ):
+        """Set channel state and read device back.
+
+        Channel changes of the same device requested within batch window
+        (e.g. by a scene) share one queue slot and one read-back.
+        """
+        batch = self.__channel_batches.get(device.mac_addr)
+        if batch is None:
+            future = asyncio.get_running_loop().create_future()
+            # Exception is retrieved by callers, unless all were cancelled.
+            future.add_done_callback(lambda fut: fut.cancelled() or fut.exception())
+            batch = self.__channel_batches[device.mac_addr] = ({}, future)
+            asyncio.get_running_loop().create_task(
+                self._async_send_channel_batch(device)
+            )
+        batch[0][channel] = state
+        await asyncio.shield(batch[1])
+
+    async def _async_send_channel_batch(self, device: FoxBaseDevice):
+        """Send collected channel states of device and read it back."""
+        await asyncio.sleep(CHANNEL_BATCH_WINDOW)
+        states, future = self.__channel_batches.pop(device.mac_addr)
+        try:
+            await self._submit(
+                device,
+                PRIORITY_COMMAND,
+                # Device is passed by keyword, so recorded job args stay
+                # JSON serializable during traffic capture.
+                partial(self._async_update_channel_states, states, device=device),
+            )
+            await self.async_confirm_device(device)
+        except Exception as err:  # pylint: disable=broad-except
+            future.set_exception(err)
+        else:
+            future.set_result(None)
+
+    @staticmethod
+    async def _async_update_channel_states(
+        states: dict[int | None, bool], *, device: FoxBaseDevice
+    ):
+        """Send channel states one after another within one request slot."""
+        for channel, state in states.items():
+            await device.async_update_channel_state(state, channel)
+
+    async def async_fetch_device_info(self, device: FoxBaseDevice):
+        """Fetch static device info, after any other device requests."""
+        await self._submit(device, PRIORITY_INFO, device.async_fetch_device_info)
+        self._device_info_fetched(device)
+
+    def _device_info_fetched(self, device: FoxBaseDevice):
+        """Store time of static info fetch and notify about new info."""
+        self.__info_fetched[device.mac_addr] = time.monotonic()
+        if self.on_device_info_updated is not None:
+            self.on_device_info_updated(device)
+        for listener in list(self.__info_listeners.get(device.mac_addr, ())):
+            listener()
+
+    def add_info_listener(
+        self, mac_addr: str, listener: Callable[[], None]
+    ) -> Callable[[], None]:
+        """Call listener when static info of device was refreshed.
+
+        Return callback which removes listener.
+        """
+        listeners = self.__info_listeners.setdefault(mac_addr, [])
+        listeners.append(listener)
+        return partial(listeners.remove, listener)
+
+    def _schedule_info_refresh(self, device: FoxBaseDevice):
+        """Refresh static device info in background when interval passed.
+
+        Info which was never fetched (or dropped on reconnect) comes with
+        next poll instead.
+        """
+        fetched = self.__info_fetched.get(device.mac_addr)
+        if fetched is None or time.monotonic() - fetched < DEVICE_INFO_REFRESH_INTERVAL:
+            return
+        # Not due again until this refresh fails or interval passes.
+        self.__info_fetched[device.mac_addr] = time.monotonic()
+        task = asyncio.get_running_loop().create_task(self._async_refresh_info(device))
+        self.__info_tasks.add(task)
+        task.add_done_callback(self.__info_tasks.discard)
+
+    async def _async_refresh_info(self, device: FoxBaseDevice):
+        """Refresh static device info, retried on next poll if it fails."""
+        try:
+            await self.async_fetch_device_info(device)
+        except Exception as err:  # pylint: disable=broad-except
+            _LOGGER.debug("F&F Fox device %s info refresh failed: %s", device.mac_addr, err)
+            self.__info_fetched.pop(device.mac_addr, None)
+
+    async def async_poll_device(self, device: FoxBaseDevice):
+        """Queue routine device state poll.
+
+        Client fetches device info along with state, only first poll (and
+        first one after reconnect) does so, others fetch state alone.
+        """
+        if device.mac_addr in self.__info_fetched:
+            await self._submit(device, PRIORITY_POLL, device.async_fetch_update)
+            return
+        await self._submit(
+            device, PRIORITY_POLL, device.async_fetch_device_available_data
+        )
+        self._device_info_fetched(device)
+
+    def update_device_host(self, mac_addr: str, host: str) -> bool:
+        """Point device to new host. Return True if host was changed."""
+        device_data = self.__device_configs.get(mac_addr)
+        if device_data is None or device_data.host == host:
+            return False
+        _LOGGER.info(
+            "F&F Fox device %s moved from %s to %s.", mac_addr, device_data.host, host
+        )
+        device_data.host = host
+        new_device = get_device_class(self.__device_models[mac_addr])(device_data)
+        # Replace device in the same slot, so entities indexes remain valid.
+        for platform_devices in self.__devices_map.values():
+            for idx, device in enumerate(platform_devices):
+                if device.mac_addr == mac_addr:
+                    platform_devices[idx] = new_device
+        self.__available.pop(mac_addr, None)
+        self.__unreachable.discard(mac_addr)
+        self.__info_fetched.pop(mac_addr, None)
+        return True
+
+    def get_device_host(self, mac_addr: str) -> str | None:
+        """Get host of configured device."""
+        device_data = self.__device_configs.get(mac_addr)
+        return None if device_data is None else device_data.host
+
+    async def async_fetch_devices(
+        self, devices: list[FoxBaseDevice], planned: bool = True
+    ):
+        """Fetch available data of given devices.
+
+        Devices which did not answer before poll deadline are marked
+        unavailable, so results of others are published on time.
+        Unreachable devices are left to the liveness probe. Planned polls
+        skip devices with all entities disabled and poll devices without
+        watched entities at background interval, when set.
+        """
+        devices = [
+            device
+            for device in devices
+            if device.mac_addr not in self.__unreachable
+            and (
+                not planned
+                or device.mac_addr not in self.__idle
+                and self._is_poll_due(device)
+            )
+        ]
+        if not devices:
+            return
+        now = time.monotonic()
+        for device in devices:
+            self.__last_polled[device.mac_addr] = now
+        tasks = {
+            asyncio.ensure_future(self.async_poll_device(device)): device
+            for device in devices
+        }
+        done, pending = await asyncio.wait(tasks, timeout=self.poll_deadline)
+        for task in pending:
+            task.cancel()
+        with self.watchdog.measure(SECTION_COORDINATOR_UPDATE, "poll cycle"):
+            for task, device in tasks.items():
+                failed = (
+                    task in pending or task.cancelled() or task.exception() is not None
                 )
-            elif DEVICES[device_data.dev_type] == DEVICE_MODEL_R2S2:
-                self.__devices_map[DEVICE_PLATFORM[device_data.dev_type]].append(
-                    FoxR2S2Device(device_data)
+                if failed and task in done and not task.cancelled():
+                    _LOGGER.debug(
+                        "F&F Fox device %s poll failed: %s",
+                        device.mac_addr,
+                        task.exception(),
+                    )
+                self._update_availability(device, failed=failed)
+                if not failed:
+                    self._schedule_info_refresh(device)
+
+    def _update_availability(self, device: FoxBaseDevice, failed: bool = False):
+        """Track device availability and notify about lost devices."""
+        was_available = self.__available.get(device.mac_addr)
+        available = bool(device.is_available) and not failed
+        self.__available[device.mac_addr] = available
+        if available and was_available is False:
+            # Device may have been replaced or updated while offline.
+            self.__info_fetched.pop(device.mac_addr, None)
+        if available:
+            self.__unreachable.discard(device.mac_addr)
+            self.__last_good[device.mac_addr] = time.monotonic()
+        else:
+            self.__unreachable.add(device.mac_addr)
+            if self._is_in_grace(device) and device.mac_addr not in self.__revalidating:
+                self.__revalidating[device.mac_addr] = asyncio.get_running_loop().create_task(
+                    self._async_revalidate(device)
                 )
-            elif DEVICES[device_data.dev_type] == DEVICE_MODEL_STR1S2:
-                self.__devices_map[DEVICE_PLATFORM[device_data.dev_type]].append(
-                    FoxSTR1S2Device(device_data)
+        if (
+            available is False
+            and was_available is not False
+            and self.on_device_unavailable is not None
+        ):
+            self.on_device_unavailable(device)
+
+    async def async_probe_unreachable(self, _now=None):
+        """Probe unreachable devices, polls resume for ones which answer."""
+        devices = [
+            device
+            for device in self.get_all_devices()
+            if device.mac_addr in self.__unreachable
+        ]
+        results = await asyncio.gather(
+            *(
+                async_probe_host(
+                    self.get_device_host(device.mac_addr),
+                    DEVICE_PORT,
+                    self.connect_timeout,
                 )
-        except KeyError:
-            _LOGGER.error("Unsupported F&F Fox device type.")
+                for device in devices
+            )
+        )
+        for device, reachable in zip(devices, results):
+            if reachable:
+                _LOGGER.debug("F&F Fox device %s is reachable again.", device.mac_addr)
+                self.__unreachable.discard(device.mac_addr)
+
+    async def _async_revalidate(self, device: FoxBaseDevice):
+        """Refresh state of device which failed, while its stale state is served."""
+        try:
+            if await async_probe_host(
+                self.get_device_host(device.mac_addr), DEVICE_PORT, self.connect_timeout
+            ):
+                try:
+                    await self.async_poll_device(device)
+                except RETRY_ERRORS:
+                    self._update_availability(device, failed=True)
+                else:
+                    self._update_availability(device)
+        finally:
+            self.__revalidating.pop(device.mac_addr, None)
+
+    def _is_in_grace(self, device: FoxBaseDevice) -> bool:
+        """Return True if last good state of device may still be served."""
+        last_good = self.__last_good.get(device.mac_addr)
+        return last_good is not None and time.monotonic() - last_good <= self.stale_grace
+
+    def is_device_available(self, device: FoxBaseDevice) -> bool:
+        """Return True if device answered recently enough to serve its state."""
+        if self.__available.get(device.mac_addr, device.is_available):
+            return True
+        return self._is_in_grace(device)
+
+    def get_data_age(self, device: FoxBaseDevice) -> float | None:
+        """Return age (in seconds) of served device state, 0 when it is fresh."""
+        if self.__available.get(device.mac_addr):
+            return 0
+        last_good = self.__last_good.get(device.mac_addr)
+        if last_good is None:
+            return None
+        return round(time.monotonic() - last_good)
+
+    def get_snapshot(self) -> list[dict]:
+        """Return in-memory state of all devices, without device requests."""
+        now = time.monotonic()
+        snapshot = []
+        for device in self.get_all_devices():
+            mac_addr = device.mac_addr
+            last_polled = self.__last_polled.get(mac_addr)
+            latency = self.__latency.get(mac_addr)
+            snapshot.append(
+                {
+                    "mac_addr": mac_addr,
+                    "name": device.name,
+                    "model": self.get_device_model(device),
+                    "host": self.get_device_host(mac_addr),
+                    "available": self.is_device_available(device),
+                    "polled": mac_addr not in self.__idle,
+                    "watched": self.is_device_watched(device),
+                    "data_age": self.get_data_age(device),
+                    "poll_age": (
+                        None if last_polled is None else round(now - last_polled, 1)
+                    ),
+                    "latency_ms": None if latency is None else round(latency * 1000),
+                    "state": device_state(device),
+                }
+            )
+        return snapshot
 
     @Throttle(THROTTLE_TIME)
     async def async_fetch_light_devices(self):
         """Get light device list."""
-        # First call update method for each device
-        await asyncio.gather(
-            *(
-                light.async_fetch_device_available_data()
-                for light in self.__devices_map[SUPPORTED_PLATFORM_LIGHT]
-            )
+        await self.async_fetch_devices(
+            self.__devices_map[SUPPORTED_PLATFORM_LIGHT]
         )
 
     @Throttle(THROTTLE_TIME)
     async def async_fetch_switch_devices(self):
         """Get all switch devices."""
-        await asyncio.gather(
-            *(
-                switch.async_fetch_device_available_data()
-                for switch in self.__devices_map[SUPPORTED_PLATFORM_SWITCH]
-            )
+        await self.async_fetch_devices(
+            self.__devices_map[SUPPORTED_PLATFORM_SWITCH]
         )
 
     @Throttle(THROTTLE_TIME)
     async def async_fetch_cover_devices(self):
         """Get all covers devices."""
-        await asyncio.gather(
-            *(
-                cover.async_fetch_device_available_data()
-                for cover in self.__devices_map[SUPPORTED_PLATFORM_COVER]
-            )
+        await self.async_fetch_devices(
+            self.__devices_map[SUPPORTED_PLATFORM_COVER]
         )
 
     def get_cover_devices(self):
@@ -163,20 +678,54 @@ class FoxDevicesCoordinator:
         """Get sensor devices."""
         sensors = []
         for switch in self.__devices_map[SUPPORTED_PLATFORM_SWITCH]:
-            if isinstance(switch, FoxR1S1Device):
+            if self.get_device_model(switch) == DEVICE_MODEL_R1S1:
                 sensors.append(switch)
         return sensors
 
+    def get_all_devices(self):
+        """Get devices of all platforms."""
+        devices = []
+        for platform_devices in self.__devices_map.values():
+            devices.extend(platform_devices)
+        return devices
+
+    def _is_poll_due(self, device: FoxBaseDevice) -> bool:
+        """Return True if device is watched or its background poll is due."""
+        if not self.background_pooling or self.is_device_watched(device):
+            return True
+        last_polled = self.__last_polled.get(device.mac_addr)
+        return (
+            last_polled is None
+            or time.monotonic() - last_polled >= self.background_pooling
+        )
+
+    def is_device_watched(self, device: FoxBaseDevice) -> bool:
+        """Return True if device entities are watched."""
+        return self.__watched is None or device.mac_addr in self.__watched
+
+    def set_watched_devices(self, mac_addrs: set[str]) -> None:
+        """Set devices whose entities are watched by frontend or automations."""
+        if mac_addrs != self.__watched:
+            _LOGGER.debug("F&F Fox devices polled at full rate: %s", mac_addrs)
+        self.__watched = set(mac_addrs)
+
+    def set_idle_devices(self, mac_addrs: set[str]) -> None:
+        """Set devices whose entities are all disabled."""
+        if mac_addrs != self.__idle:
+            _LOGGER.debug("F&F Fox devices left out of polls: %s", mac_addrs)
+        self.__idle = set(mac_addrs)
+
+    def get_device_model(self, device) -> str:
+        """Get device model name."""
+        return self.__device_models[device.mac_addr]
+
 
 async def _assign_area_to_devices(
     hass: HomeAssistant, coordinator: FoxDevicesCoordinator, area_id: str
 ):
     """Assign all devices to the given area."""
     registry = dr.async_get(hass)
-    devices = []
-    for platform_devices in coordinator._FoxDevicesCoordinator__devices_map.values():
-        devices.extend(platform_devices)
-    for device in devices:
+    for device in coordinator.get_all_devices():
         entry = registry.async_get_device(
             identifiers={(device.device_platform, device.mac_addr)}
         )
@@ -185,3 +734,73 @@ async def _assign_area_to_devices(
         if entry.area_id == area_id:
             continue
         registry.async_update_device(entry.id, area_id=area_id)
+
+
+@callback
+def _async_update_device_registry(hass: HomeAssistant, device: FoxBaseDevice):
+    """Update registered device with refreshed static device info."""
+    registry = dr.async_get(hass)
+    entry = registry.async_get_device(
+        identifiers={(device.device_platform, device.mac_addr)}
+    )
+    if entry is None:
+        return
+    info = device.get_device_info()
+    changes = {
+        key: info[key]
+        for key in ("name", "model", "sw_version", "hw_version")
+        if info.get(key) is not None and info[key] != getattr(entry, key)
+    }
+    if changes:
+        registry.async_update_device(entry.id, **changes)
+
+
+@callback
+def _async_track_entity_usage(
+    hass: HomeAssistant, entry: ConfigEntry, coordinator: FoxDevicesCoordinator
+) -> Callable[[], None]:
+    """Keep devices with all entities disabled out of polls.
+
+    Return callback which stops tracking.
+    """
+    registry = er.async_get(hass)
+    mac_addrs = [device.mac_addr for device in coordinator.get_all_devices()]
+    # Entities of the entry, removed ones are not in registry anymore.
+    entity_ids: set[str] = set()
+
+    @callback
+    def _async_is_entry_entity(event_data: Mapping[str, Any]) -> bool:
+        """Return True if event changes entity usage of this entry."""
+        if event_data["action"] == "remove":
+            return event_data["entity_id"] in entity_ids
+        if event_data["action"] == "update" and "disabled_by" not in event_data.get(
+            "changes", {}
+        ):
+            return False
+        entity = registry.async_get(event_data["entity_id"])
+        return entity is not None and entity.config_entry_id == entry.entry_id
+
+    @callback
+    def _async_update(_event: Event | None = None) -> None:
+        """Find devices without enabled entities."""
+        disabled: dict[str, bool] = {}
+        entities = er.async_entries_for_config_entry(registry, entry.entry_id)
+        entity_ids.clear()
+        entity_ids.update(entity.entity_id for entity in entities)
+        for entity in entities:
+            for mac_addr in mac_addrs:
+                # Unique ids of all platforms start with device MAC address.
+                if entity.unique_id.startswith(f"{mac_addr}-"):
+                    disabled[mac_addr] = (
+                        disabled.get(mac_addr, True) and entity.disabled
+                    )
+        coordinator.set_idle_devices(
+            {mac_addr for mac_addr, idle in disabled.items() if idle}
+        )
+
+    _async_update()
+    return hass.bus.async_listen(
+        er.EVENT_ENTITY_REGISTRY_UPDATED,
+        _async_update,
+        event_filter=_async_is_entry_entity,
+    )
@@ -0,0 +1,398 @@
+"""Capture and replay of F&F Fox device traffic."""
+from __future__ import annotations
+
+import asyncio
+from collections import defaultdict, deque
+from collections.abc import Awaitable, Callable
+import gzip
+import json
+import logging
+import time
+from typing import TYPE_CHECKING, Any
+
+import aiohttp
+from foxrestapiclient.devices.const import DEVICES
+from foxrestapiclient.devices.fox_base_device import DeviceData
+import voluptuous as vol
+
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import config_validation as cv
+
+from .const import DOMAIN, SCHEMA_INPUT_REQUEST_RETRIES
+from .scheduler import PRIORITY_COMMAND, PRIORITY_INFO, PRIORITY_POLL, RETRY_ERRORS
+
+if TYPE_CHECKING:
+    from . import FoxDevicesCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+SERVICE_CAPTURE = "capture"
+SERVICE_REPLAY = "replay"
+ATTR_DURATION = "duration"
+ATTR_FILE = "file"
+ATTR_SPEED = "speed"
+CAPTURE_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_DURATION, default=300): vol.All(
+            vol.Coerce(float), vol.Range(min=1, max=3600)
+        ),
+    }
+)
+REPLAY_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_FILE): cv.string,
+        vol.Optional(ATTR_SPEED, default=1): vol.All(
+            vol.Coerce(float), vol.Range(min=0.1, max=100)
+        ),
+    }
+)
+# Version of capture file format.
+CAPTURE_VERSION = 1
+# Recorded error kinds.
+ERROR_TIMEOUT = "timeout"
+ERROR_CLIENT = "client"
+ERROR_OS = "os"
+# Address of stand-in devices of replay, reserved for documentation and
+# never routed, so replay cannot reach any device.
+REPLAY_HOST = "192.0.2.1"
+
+_TRAFFIC_LOCK = asyncio.Lock()
+
+
+def job_name(job: Callable[[], Awaitable[Any]]) -> str:
+    """Return name of device method called by request job."""
+    return getattr(getattr(job, "func", job), "__name__", repr(job))
+
+
+def _is_serializable(value: Any) -> bool:
+    """Return True if value can be written to capture."""
+    try:
+        json.dumps(value)
+    except (TypeError, ValueError):
+        return False
+    return True
+
+
+def device_state(device) -> dict[str, Any]:
+    """Return JSON serializable attributes of device object."""
+    return {
+        key: value
+        for key, value in vars(device).items()
+        # Captures are shared for analysis, keep credentials out.
+        if "api_key" not in key and _is_serializable(value)
+    }
+
+
+def job_args(job: Callable[[], Awaitable[Any]]) -> list[Any]:
+    """Return JSON serializable positional args of request job."""
+    return [arg for arg in getattr(job, "args", ()) if _is_serializable(arg)]
+
+
+def _error_kind(err: BaseException) -> str:
+    """Return recorded kind of request error."""
+    if isinstance(err, (asyncio.TimeoutError, asyncio.CancelledError)):
+        return ERROR_TIMEOUT
+    if isinstance(err, aiohttp.ClientError):
+        return ERROR_CLIENT
+    return ERROR_OS
+
+
+def _write_capture(path: str, header: dict, records: list[dict]) -> None:
+    """Write capture as gzip compressed JSON lines (blocking)."""
+    with gzip.open(path, "wt", encoding="utf-8") as file:
+        file.write(json.dumps(header, separators=(",", ":")) + "\n")
+        for record in records:
+            file.write(json.dumps(record, separators=(",", ":")) + "\n")
+
+
+def _read_capture(path: str) -> tuple[dict, list[dict]]:
+    """Read capture file (blocking)."""
+    with gzip.open(path, "rt", encoding="utf-8") as file:
+        header = json.loads(file.readline())
+        records = [json.loads(line) for line in file if line.strip()]
+    if header.get("version") != CAPTURE_VERSION:
+        raise ValueError(f"unsupported capture version {header.get('version')}")
+    return header, records
+
+
+class FoxTrafficCapture:
+    """Record device requests with their timing and resulting device state."""
+
+    def __init__(self) -> None:
+        """Initialize object."""
+        self._started = time.monotonic()
+        self.records: list[dict[str, Any]] = []
+
+    def track(self, device, name: str, future: asyncio.Future) -> None:
+        """Track queued request, not needed by capture."""
+
+    async def async_call(
+        self, device, job: Callable[[], Awaitable[Any]], priority: int
+    ) -> Any:
+        """Call device and record request."""
+        record = {
+            "t": round(time.monotonic() - self._started, 4),
+            "mac": device.mac_addr,
+            "call": job_name(job),
+            "args": job_args(job),
+            "priority": priority,
+        }
+        started = time.monotonic()
+        try:
+            result = await job()
+        except (asyncio.CancelledError, *RETRY_ERRORS) as err:
+            record["elapsed"] = round(time.monotonic() - started, 4)
+            record["error"] = _error_kind(err)
+            record["message"] = str(err)
+            self.records.append(record)
+            raise
+        record["elapsed"] = round(time.monotonic() - started, 4)
+        record["state"] = device_state(device)
+        self.records.append(record)
+        return result
+
+
+class FoxTrafficReplay:
+    """Answer requests of stand-in devices from capture.
+
+    Each request is answered by next recorded request of the same device
+    method, after its recorded time divided by speed. Recorded device state
+    is applied to stand-in device object.
+    """
+
+    def __init__(self, records: list[dict[str, Any]], speed: float) -> None:
+        """Initialize object."""
+        self._speed = speed
+        self._records: dict[str, dict[str, deque]] = defaultdict(
+            lambda: defaultdict(deque)
+        )
+        for record in records:
+            self._records[record["mac"]][record["call"]].append(record)
+        self._waits: dict[str, list[float]] = defaultdict(list)
+        self._latencies: dict[str, list[float]] = defaultdict(list)
+
+    def track(self, device, name: str, future: asyncio.Future) -> None:
+        """Measure time from queueing request until it is answered."""
+        queued = time.monotonic()
+        future.add_done_callback(
+            lambda _: self._waits[name].append(time.monotonic() - queued)
+        )
+
+    async def async_call(
+        self, device, job: Callable[[], Awaitable[Any]], priority: int
+    ) -> Any:
+        """Answer request from capture, never calling the device."""
+        name = job_name(job)
+        calls = self._records.get(device.mac_addr)
+        if not calls or not calls.get(name):
+            # Used up, e.g. merged polls, stand-in keeps its last state.
+            return None
+        record = calls[name].popleft()
+        await asyncio.sleep(record["elapsed"] / self._speed)
+        self._latencies[name].append(record["elapsed"])
+        if "error" in record:
+            if record["error"] == ERROR_TIMEOUT:
+                raise asyncio.TimeoutError
+            if record["error"] == ERROR_CLIENT:
+                raise aiohttp.ClientError(record.get("message"))
+            raise OSError(record.get("message"))
+        for key, value in record.get("state", {}).items():
+            setattr(device, key, value)
+        return None
+
+    def summary(self) -> dict[str, Any]:
+        """Return replay statistics by device method, times in milliseconds."""
+        summary = {}
+        for name, latencies in self._latencies.items():
+            waits = self._waits.get(name) or [0.0]
+            summary[name] = {
+                "requests": len(latencies),
+                "recorded_mean_ms": round(sum(latencies) / len(latencies) * 1000, 1),
+                "recorded_max_ms": round(max(latencies) * 1000, 1),
+                "queued_mean_ms": round(sum(waits) / len(waits) * 1000, 1),
+                "queued_max_ms": round(max(waits) * 1000, 1),
+            }
+        return summary
+
+
+def _record_priority(record: dict[str, Any]) -> int:
+    """Return queue priority of recorded request."""
+    if "priority" in record:
+        return record["priority"]
+    # Captures made before priorities were recorded.
+    if record["call"] in ("async_fetch_device_available_data", "async_fetch_update"):
+        return PRIORITY_POLL
+    if record["call"] == "async_fetch_device_info":
+        return PRIORITY_INFO
+    return PRIORITY_COMMAND
+
+
+def _replay_job(name: str) -> Callable[[], Awaitable[None]]:
+    """Return request job named as recorded device method."""
+
+    async def _async_job() -> None:
+        """Stand-in request, answered by replay."""
+
+    _async_job.__name__ = name
+    return _async_job
+
+
+def _coordinators(hass: HomeAssistant) -> list[FoxDevicesCoordinator]:
+    """Return coordinators of loaded config entries."""
+    return list(hass.data.get(DOMAIN, {}).values())
+
+
+async def _async_build_replay_coordinator(
+    hass: HomeAssistant, header: dict[str, Any]
+) -> FoxDevicesCoordinator:
+    """Return coordinator of stand-in devices of captured devices."""
+    # pylint: disable-next=import-outside-toplevel
+    from . import FoxDevicesCoordinator, load_device_classes
+
+    coordinators = _coordinators(hass)
+    options = dict(coordinators[0].options) if coordinators else {}
+    # Retries were captured as separate requests and are replayed as such.
+    options[SCHEMA_INPUT_REQUEST_RETRIES] = 0
+    dev_types = {model: dev_type for dev_type, model in DEVICES.items()}
+    devices = [
+        device for device in header.get("devices", []) if device["model"] in dev_types
+    ]
+    await hass.async_add_executor_job(
+        load_device_classes, {device["model"] for device in devices}
+    )
+    coordinator = FoxDevicesCoordinator(options)
+    for device in devices:
+        coordinator.add_device_by_config(
+            DeviceData(
+                name=device["name"],
+                host=REPLAY_HOST,
+                api_key="",
+                mac_addr=device["mac"],
+                dev_type=dev_types[device["model"]],
+            )
+        )
+    return coordinator
+
+
+async def async_replay(hass: HomeAssistant, path: str, speed: float) -> dict[str, Any]:
+    """Replay capture on stand-in devices, return replay statistics.
+
+    Recorded requests are queued at their recorded times divided by speed
+    on a separate coordinator, so queueing, timeouts and event loop stalls
+    are reproduced without touching configured devices.
+    """
+    try:
+        header, records = await hass.async_add_executor_job(
+            _read_capture, hass.config.path(path)
+        )
+    except (OSError, ValueError) as err:
+        raise HomeAssistantError(f"Unable to read capture {path}: {err}") from err
+    coordinator = await _async_build_replay_coordinator(hass, header)
+    devices = {device.mac_addr: device for device in coordinator.get_all_devices()}
+    records = [record for record in records if record["mac"] in devices]
+    if not records:
+        raise HomeAssistantError(f"No supported device is recorded in {path}")
+    replay = FoxTrafficReplay(records, speed)
+    coordinator.traffic = replay
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    requests = []
+    try:
+        for record in sorted(records, key=lambda record: record["t"]):
+            delay = record["t"] / speed - (loop.time() - started)
+            if delay > 0:
+                await asyncio.sleep(delay)
+            requests.append(
+                coordinator.submit_request(
+                    devices[record["mac"]],
+                    _record_priority(record),
+                    _replay_job(record["call"]),
+                )
+            )
+        await asyncio.gather(*requests, return_exceptions=True)
+    finally:
+        coordinator.shutdown()
+    return {"calls": replay.summary(), "watchdog": coordinator.watchdog.as_dict()}
+
+
+async def async_capture(hass: HomeAssistant, duration: float) -> str:
+    """Capture traffic of all devices for given time, return file path."""
+    coordinators = _coordinators(hass)
+    capture = FoxTrafficCapture()
+    for coordinator in coordinators:
+        coordinator.traffic = capture
+    try:
+        await asyncio.sleep(duration)
+    finally:
+        for coordinator in coordinators:
+            coordinator.traffic = None
+    header = {
+        "version": CAPTURE_VERSION,
+        "duration": duration,
+        "devices": [
+            {
+                "mac": device.mac_addr,
+                "model": coordinator.get_device_model(device),
+                "name": device.name,
+            }
+            for coordinator in coordinators
+            for device in coordinator.get_all_devices()
+        ],
+    }
+    path = hass.config.path(f"{DOMAIN}_capture_{int(time.time())}.jsonl.gz")
+    await hass.async_add_executor_job(_write_capture, path, header, capture.records)
+    _LOGGER.info("F&F Fox traffic of %d requests written to %s", len(capture.records), path)
+    return path
+
+
+@callback
+def async_register_capture_services(hass: HomeAssistant) -> None:
+    """Register capture and replay services unless registered already."""
+    if hass.services.has_service(DOMAIN, SERVICE_CAPTURE):
+        return
+
+    async def _async_capture(call: ServiceCall) -> ServiceResponse:
+        """Capture device traffic."""
+        if _TRAFFIC_LOCK.locked():
+            raise HomeAssistantError("F&F Fox capture or replay is already running")
+        async with _TRAFFIC_LOCK:
+            path = await async_capture(hass, call.data[ATTR_DURATION])
+        return {"file": path}
+
+    async def _async_replay(call: ServiceCall) -> ServiceResponse:
+        """Replay captured device traffic."""
+        if _TRAFFIC_LOCK.locked():
+            raise HomeAssistantError("F&F Fox capture or replay is already running")
+        async with _TRAFFIC_LOCK:
+            return await async_replay(
+                hass, call.data[ATTR_FILE], call.data[ATTR_SPEED]
+            )
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_CAPTURE,
+        _async_capture,
+        schema=CAPTURE_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_REPLAY,
+        _async_replay,
+        schema=REPLAY_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+
+@callback
+def async_remove_capture_services(hass: HomeAssistant) -> None:
+    """Remove capture and replay services."""
+    hass.services.async_remove(DOMAIN, SERVICE_CAPTURE)
+    hass.services.async_remove(DOMAIN, SERVICE_REPLAY)
@@ -1,6 +1,7 @@
 """Config flow for F&F Fox devices."""
 from __future__ import annotations
 
+import asyncio
 import ipaddress
 import logging
 import re
@@ -16,6 +17,15 @@ from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import area_registry as ar
 
 from .const import (
+    DEFAULT_CONNECT_TIMEOUT,
+    DEFAULT_COORDINATOR_TIMEOUT,
+    DEFAULT_REQUEST_RETRIES,
+    DEFAULT_REQUEST_TIMEOUT,
+    DEFAULT_STALE_GRACE,
+    DEFAULT_ENERGY_STATE_INTERVAL,
+    DEFAULT_STALL_THRESHOLD,
+    DEFAULT_BACKGROUND_POOLING,
+    DEFAULT_SCAN_RATE,
     DOMAIN,
     POOLING_INTERVAL,
     SCHEMA_INPUT_DEVICE_API_KEY,
@@ -29,7 +39,29 @@ from .const import (
     SCHEMA_INPUT_AREA_ID,
     SCHEMA_INPUT_UPDATE_POOLING,
     SCHEMA_INPUT_SKIP_CONFIG,
+    SCHEMA_INPUT_POLL_DEADLINE,
+    SCHEMA_INPUT_CONNECT_TIMEOUT,
+    SCHEMA_INPUT_REQUEST_RETRIES,
+    SCHEMA_INPUT_REQUEST_TIMEOUT,
+    SCHEMA_INPUT_STALE_GRACE,
+    SCHEMA_INPUT_POWER_SAMPLE_INTERVAL,
+    SCHEMA_INPUT_ENERGY_STATE_INTERVAL,
+    SCHEMA_INPUT_STALL_THRESHOLD,
+    SCHEMA_INPUT_BACKGROUND_POOLING,
+    SCHEMA_INPUT_SCAN_ADAPTERS,
+    SCHEMA_INPUT_SCAN_RATE,
+    SCHEMA_INPUT_SUBNETS,
+    SCAN_MAX_HOSTS,
 )
+from .discovery import (
+    async_get_adapter_networks,
+    async_sweep_hosts,
+    count_hosts,
+    merge_devices,
+    network_hosts,
+    parse_networks,
+)
+from .scheduler import async_call_with_retry
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -93,7 +125,11 @@ async def validate_input(
     errors = {}
 
     try:
-        fetched_data = await FoxBaseDevice(device_data).async_fetch_device_info()
+        fetched_data = await async_call_with_retry(
+            FoxBaseDevice(device_data).async_fetch_device_info,
+            DEFAULT_REQUEST_TIMEOUT,
+            DEFAULT_REQUEST_RETRIES,
+        )
         if fetched_data is False:
             errors[SCHEMA_INPUT_DEVICE_API_KEY] = "wrong_api_key"
     except Exception:
@@ -132,6 +168,18 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
         errors = {}
         if user_input is not None:
             errors = await validate_input_pooling(self.hass, user_input[SCHEMA_INPUT_UPDATE_POOLING])
+            if user_input[SCHEMA_INPUT_POLL_DEADLINE] < user_input[SCHEMA_INPUT_REQUEST_TIMEOUT]:
+                errors[SCHEMA_INPUT_POLL_DEADLINE] = "deadline_too_short"
+            if 0 < user_input[SCHEMA_INPUT_POWER_SAMPLE_INTERVAL] < 0.5:
+                errors[SCHEMA_INPUT_POWER_SAMPLE_INTERVAL] = "sample_interval_too_short"
+            if 0 < user_input[SCHEMA_INPUT_STALL_THRESHOLD] < 5:
+                errors[SCHEMA_INPUT_STALL_THRESHOLD] = "stall_threshold_too_short"
+            if (
+                SCHEMA_INPUT_UPDATE_POOLING not in errors
+                and 0 < user_input[SCHEMA_INPUT_BACKGROUND_POOLING]
+                < float(user_input[SCHEMA_INPUT_UPDATE_POOLING])
+            ):
+                errors[SCHEMA_INPUT_BACKGROUND_POOLING] = "background_too_short"
             if errors == {}:
                 user_input[SCHEMA_INPUT_UPDATE_POOLING] = float(user_input[SCHEMA_INPUT_UPDATE_POOLING])
                 return self.async_create_entry(title="F&F Fox", data=user_input)
@@ -143,6 +191,42 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                     vol.Required(SCHEMA_INPUT_UPDATE_POOLING,
                         default=("" if SCHEMA_INPUT_UPDATE_POOLING not in self.config_entry.options
                         else str(self.config_entry.options.get(SCHEMA_INPUT_UPDATE_POOLING)))): str,
+                    vol.Required(SCHEMA_INPUT_REQUEST_TIMEOUT,
+                        default=self.config_entry.options.get(
+                            SCHEMA_INPUT_REQUEST_TIMEOUT, DEFAULT_REQUEST_TIMEOUT)): vol.All(
+                        vol.Coerce(float), vol.Range(min=0.5, max=60)),
+                    vol.Required(SCHEMA_INPUT_REQUEST_RETRIES,
+                        default=self.config_entry.options.get(
+                            SCHEMA_INPUT_REQUEST_RETRIES, DEFAULT_REQUEST_RETRIES)): vol.All(
+                        vol.Coerce(int), vol.Range(min=0, max=5)),
+                    vol.Required(SCHEMA_INPUT_POLL_DEADLINE,
+                        default=self.config_entry.options.get(
+                            SCHEMA_INPUT_POLL_DEADLINE, DEFAULT_COORDINATOR_TIMEOUT)): vol.All(
+                        vol.Coerce(float), vol.Range(min=1, max=300)),
+                    vol.Required(SCHEMA_INPUT_CONNECT_TIMEOUT,
+                        default=self.config_entry.options.get(
+                            SCHEMA_INPUT_CONNECT_TIMEOUT, DEFAULT_CONNECT_TIMEOUT)): vol.All(
+                        vol.Coerce(float), vol.Range(min=0.2, max=30)),
+                    vol.Required(SCHEMA_INPUT_STALE_GRACE,
+                        default=self.config_entry.options.get(
+                            SCHEMA_INPUT_STALE_GRACE, DEFAULT_STALE_GRACE)): vol.All(
+                        vol.Coerce(float), vol.Range(min=0, max=3600)),
+                    vol.Required(SCHEMA_INPUT_POWER_SAMPLE_INTERVAL,
+                        default=self.config_entry.options.get(
+                            SCHEMA_INPUT_POWER_SAMPLE_INTERVAL, 0)): vol.All(
+                        vol.Coerce(float), vol.Range(min=0, max=60)),
+                    vol.Required(SCHEMA_INPUT_ENERGY_STATE_INTERVAL,
+                        default=self.config_entry.options.get(
+                            SCHEMA_INPUT_ENERGY_STATE_INTERVAL, DEFAULT_ENERGY_STATE_INTERVAL)): vol.All(
+                        vol.Coerce(float), vol.Range(min=0, max=3600)),
+                    vol.Required(SCHEMA_INPUT_STALL_THRESHOLD,
+                        default=self.config_entry.options.get(
+                            SCHEMA_INPUT_STALL_THRESHOLD, DEFAULT_STALL_THRESHOLD)): vol.All(
+                        vol.Coerce(int), vol.Range(min=0, max=10000)),
+                    vol.Required(SCHEMA_INPUT_BACKGROUND_POOLING,
+                        default=self.config_entry.options.get(
+                            SCHEMA_INPUT_BACKGROUND_POOLING, DEFAULT_BACKGROUND_POOLING)): vol.All(
+                        vol.Coerce(float), vol.Range(min=0, max=3600)),
                 }
             ),
             errors=errors,
@@ -164,6 +248,8 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         self._default_api_key = "000"
         self._assign_area = False
         self._area_id = None
+        self._networks: list[ipaddress.IPv4Network] = []
+        self._scan_rate = DEFAULT_SCAN_RATE
 
     @staticmethod
     @callback
@@ -173,10 +259,17 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     async def _async_do_discover_task(self):
         """Do service discovery task."""
 
-        # Discover F&F Fox devices in local network
-        self._discovered_devices = await self._fox_service_discovery.async_discover_devices(
-            default_tries=6, interval=2
+        # Discover F&F Fox devices in local network by broadcast and sweep
+        # given networks by unicast at the same time.
+        # Size of networks, including adapter ones, was checked in user step.
+        hosts = network_hosts(self._networks)
+        broadcast, swept = await asyncio.gather(
+            self._fox_service_discovery.async_discover_devices(
+                default_tries=6, interval=2
+            ),
+            async_sweep_hosts(hosts, self._default_api_key, self._scan_rate),
         )
+        self._discovered_devices = merge_devices(broadcast, swept)
         # Filter out devices already configured
         existing_macs = set()
         for entry in self._async_current_entries():
@@ -198,10 +291,23 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     async def async_step_user(self, user_input: dict[str, Any] | None = None):
         """Handle the initial step."""
+        errors = {}
         # Check it is already configured
         if self._async_current_entries():
             return self.async_abort(reason="single_instance_allowed")
         if user_input is not None:
+            try:
+                self._networks = parse_networks(user_input.get(SCHEMA_INPUT_SUBNETS, ""))
+            except ValueError:
+                errors[SCHEMA_INPUT_SUBNETS] = "invalid_subnet"
+            else:
+                if count_hosts(self._networks) > SCAN_MAX_HOSTS:
+                    errors[SCHEMA_INPUT_SUBNETS] = "subnet_too_large"
+                elif user_input.get(SCHEMA_INPUT_SCAN_ADAPTERS, False):
+                    self._networks += await async_get_adapter_networks(self.hass)
+                    if count_hosts(self._networks) > SCAN_MAX_HOSTS:
+                        errors[SCHEMA_INPUT_SCAN_ADAPTERS] = "adapters_too_large"
+        if user_input is not None and not errors:
             if user_input.get("manual", False):
                 return self.async_show_form(
                     step_id="manual",
@@ -212,6 +318,7 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             self._default_api_key = user_input.get(SCHEMA_INPUT_DEVICE_API_KEY, "000")
             self._assign_area = user_input.get(SCHEMA_INPUT_ASSIGN_AREA, False)
             self._area_id = user_input.get(SCHEMA_INPUT_AREA_ID)
+            self._scan_rate = user_input.get(SCHEMA_INPUT_SCAN_RATE, DEFAULT_SCAN_RATE)
             self._discover_task = self.hass.async_create_task(self._async_do_discover_task())
             return self.async_show_progress(
                 step_id="discovering_finished",
@@ -231,12 +338,17 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 vol.Optional(SCHEMA_INPUT_DEVICE_API_KEY, default="000"): str,
                 vol.Optional(SCHEMA_INPUT_ASSIGN_AREA, default=False): bool,
                 vol.Optional(SCHEMA_INPUT_AREA_ID): area_selector,
+                vol.Optional(SCHEMA_INPUT_SUBNETS, default=""): str,
+                vol.Optional(SCHEMA_INPUT_SCAN_ADAPTERS, default=False): bool,
+                vol.Optional(SCHEMA_INPUT_SCAN_RATE, default=DEFAULT_SCAN_RATE): vol.All(
+                    vol.Coerce(int), vol.Range(min=1, max=2000)),
             }
         )
         return self.async_show_form(
             step_id="user",
             data_schema=data_schema,
             description_placeholders={},
+            errors=errors,
         )
 
     async def async_step_discovering_finished(
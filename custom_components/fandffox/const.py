@@ -12,8 +12,73 @@ SCHEMA_INPUT_AUTO_ADD = "auto_add"
 SCHEMA_INPUT_ASSIGN_AREA = "assign_area"
 SCHEMA_INPUT_AREA_ID = "area_id"
 SCHEMA_INPUT_SKIP_CONFIG = "skip_config"
+SCHEMA_INPUT_SUBNETS = "subnets"
+SCHEMA_INPUT_SCAN_ADAPTERS = "scan_adapters"
+SCHEMA_INPUT_SCAN_RATE = "scan_rate"
 SCHEMA_INPUT_UPDATE_POOLING = "pooling"
+SCHEMA_INPUT_REQUEST_TIMEOUT = "request_timeout"
+SCHEMA_INPUT_REQUEST_RETRIES = "request_retries"
+SCHEMA_INPUT_POLL_DEADLINE = "poll_deadline"
+SCHEMA_INPUT_CONNECT_TIMEOUT = "connect_timeout"
+SCHEMA_INPUT_STALE_GRACE = "stale_grace"
+SCHEMA_INPUT_POWER_SAMPLE_INTERVAL = "power_sample_interval"
+SCHEMA_INPUT_ENERGY_STATE_INTERVAL = "energy_state_interval"
+SCHEMA_INPUT_STALL_THRESHOLD = "stall_threshold"
+SCHEMA_INPUT_BACKGROUND_POOLING = "background_pooling"
 
-# Default timeout (in seconds) used in all coordinators.
-DEFAULT_COORDINATOR_TIMEOUT = 30
+# Default timeout (in seconds) used in all coordinators. Poll cycle publishes
+# results of devices which answered within this time.
+DEFAULT_COORDINATOR_TIMEOUT = 10
+# Default timeout (in seconds) of single device request attempt.
+DEFAULT_REQUEST_TIMEOUT = 4
+# Default number of retries of failed device request.
+DEFAULT_REQUEST_RETRIES = 1
+# Default timeout (in seconds) of connecting to device by liveness probe.
+DEFAULT_CONNECT_TIMEOUT = 2
+# Liveness probe of unreachable devices interval (in seconds).
+DEVICE_PROBE_INTERVAL = 15
+# Default time (in seconds) for which last good device state is served
+# after device stopped answering.
+DEFAULT_STALE_GRACE = 30
+# Entity attribute with age (in seconds) of served device state.
+ATTR_DATA_AGE = "data_age"
+# Number of R1S1 power samples kept in memory per device.
+POWER_SAMPLE_BUFFER_SIZE = 3600
+# Default minimal time (in seconds) between state writes of R1S1 energy
+# counters, their history is kept as hourly statistics.
+DEFAULT_ENERGY_STATE_INTERVAL = 300
+# Default time (in milliseconds) of synchronous section run in event loop
+# after which stall watchdog warns, 0 disables watchdog.
+DEFAULT_STALL_THRESHOLD = 0
+# Number of attempts to deliver command confirmed by device state read-back.
+COMMAND_DELIVERY_ATTEMPTS = 2
+# Delay (in seconds) before command is sent again.
+COMMAND_RETRY_DELAY = 0.5
+# Time (in seconds) in which channel state changes of one device are
+# collected and sent together.
+CHANNEL_BATCH_WINDOW = 0.05
+# Event fired when command could not be delivered.
+EVENT_COMMAND_FAILED = f"{DOMAIN}_command_failed"
+# Default interval (in seconds) of polling devices whose entities are not
+# watched by frontend or automations, 0 polls all devices at full rate.
+DEFAULT_BACKGROUND_POOLING = 0
+# Interval (in seconds) of refreshing static device info (model, firmware,
+# channel names). Info is also refreshed when device reconnects.
+DEVICE_INFO_REFRESH_INTERVAL = 3600
+# Port of device REST API.
+DEVICE_PORT = 80
 POOLING_INTERVAL = 5
+
+# Background rediscovery of devices which changed IP address (seconds).
+REDISCOVERY_SCAN_INTERVAL = 1800
+# Minimal time between scans triggered by unavailable devices.
+REDISCOVERY_COOLDOWN = 60
+REDISCOVERY_TRIES = 2
+REDISCOVERY_TRY_INTERVAL = 2
+
+# Default number of hosts probed per second by subnet sweep.
+DEFAULT_SCAN_RATE = 200
+# Maximal number of probes of subnet sweep in progress.
+SCAN_CONCURRENCY = 256
+# Maximal number of hosts swept at once (/20 network).
+SCAN_MAX_HOSTS = 4096
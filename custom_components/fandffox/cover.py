@@ -1,8 +1,10 @@
 """F&F Fox cover platform implementation."""
 from __future__ import annotations
 
+import asyncio
 from datetime import timedelta
 import logging
+import time
 
 from homeassistant.components.cover import (
     ATTR_POSITION,
@@ -11,16 +13,48 @@ from homeassistant.components.cover import (
     CoverEntity,
     CoverEntityFeature,
 )
-from homeassistant.helpers import entity_platform
+from homeassistant.const import ATTR_ENTITY_ID
+from homeassistant.core import ServiceCall, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import config_validation as cv, entity_platform
 import voluptuous as vol
 from . import FoxDevicesCoordinator
-from .const import DOMAIN, POOLING_INTERVAL, SCHEMA_INPUT_UPDATE_POOLING
-from homeassistant.helpers.update_coordinator import (
-    CoordinatorEntity,
-    DataUpdateCoordinator,
+from .const import (
+    DOMAIN,
+    EVENT_COMMAND_FAILED,
+    POOLING_INTERVAL,
+    SCHEMA_INPUT_UPDATE_POOLING,
 )
+from .entity import FoxEntity
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
 _LOGGER = logging.getLogger(__name__)
+# Position and tilt requested within this time (in seconds) are sent
+# to the device as one command.
+POSITION_MERGE_WINDOW = 0.15
+# Fast poll of moving covers (in seconds).
+MOTION_POLL_INTERVAL = 1
+# Covers still moving after this time (in seconds) are no longer fast polled.
+MOTION_TIMEOUT = 120
+
+SERVICE_MOVE_COVERS = "move_covers"
+ATTR_ACTION = "action"
+ACTION_OPEN = "open"
+ACTION_CLOSE = "close"
+ACTION_STOP = "stop"
+ACTION_SET_POSITION = "set_position"
+MOVE_COVERS_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_ENTITY_ID): cv.entity_ids,
+        vol.Required(ATTR_ACTION): vol.In(
+            [ACTION_OPEN, ACTION_CLOSE, ACTION_STOP, ACTION_SET_POSITION]
+        ),
+        vol.Optional(ATTR_POSITION): vol.All(vol.Coerce(int), vol.Range(min=0, max=100)),
+        vol.Optional(ATTR_TILT_POSITION): vol.All(
+            vol.Coerce(int), vol.Range(min=0, max=100)
+        ),
+    }
+)
 
 
 async def async_setup_entry(hass, config_entry, async_add_entities):
@@ -54,9 +88,34 @@ async def async_setup_entry(hass, config_entry, async_add_entities):
 
     await coordinator.async_config_entry_first_refresh()
     for idx, ent in enumerate(coordinator.data):
-        entities.append(FoxBaseCover(coordinator, idx))
+        entities.append(FoxBaseCover(coordinator, device_coordinator, idx))
     async_add_entities(entities)
 
+    motion_tracker = FoxCoverMotionTracker(hass, coordinator, device_coordinator)
+    config_entry.async_on_unload(motion_tracker.cancel)
+
+    async def async_move_covers(call: ServiceCall) -> None:
+        """Move many covers at once."""
+        by_entity_id = {entity.entity_id: entity for entity in entities}
+        covers = [
+            by_entity_id[entity_id]
+            for entity_id in call.data[ATTR_ENTITY_ID]
+            if entity_id in by_entity_id
+        ]
+        action = call.data[ATTR_ACTION]
+        if action == ACTION_SET_POSITION and ATTR_POSITION not in call.data:
+            raise HomeAssistantError("Position is required to set position.")
+        await motion_tracker.async_move(
+            covers, action, call.data.get(ATTR_POSITION), call.data.get(ATTR_TILT_POSITION)
+        )
+
+    hass.services.async_register(
+        DOMAIN, SERVICE_MOVE_COVERS, async_move_covers, schema=MOVE_COVERS_SCHEMA
+    )
+    config_entry.async_on_unload(
+        lambda: hass.services.async_remove(DOMAIN, SERVICE_MOVE_COVERS)
+    )
+
     platform = entity_platform.async_get_current_platform()
     platform.async_register_entity_service(
         "set_cover_and_tilt_positions",
@@ -78,34 +137,139 @@ async def async_setup_entry(hass, config_entry, async_add_entities):
     return True
 
 
-class FoxBaseCover(CoordinatorEntity, CoverEntity):
-    """Fox base cover implementation."""
+class FoxCoverMotionTracker:
+    """Move covers together and fast poll them until they arrive."""
 
-    def __init__(self, coordinator: DataUpdateCoordinator, idx: int) -> None:
+    def __init__(
+        self,
+        hass,
+        coordinator: DataUpdateCoordinator,
+        device_coordinator: FoxDevicesCoordinator,
+    ) -> None:
         """Initialize object."""
-        super().__init__(coordinator)
-        self._idx = idx
-
-    @property
-    def name(self):
-        """Return the name of the device."""
-        return self.coordinator.data[self._idx].name
-
-    @property
-    def available(self):
-        """Return True if entity is available."""
-        return self.coordinator.data[self._idx].is_available
-
-    @property
-    def unique_id(self) -> str:
-        """Return a unique ID."""
-        device = self.coordinator.data[self._idx]
-        return f"{device.mac_addr}-{device.device_platform}"
+        self._hass = hass
+        self._coordinator = coordinator
+        self._device_coordinator = device_coordinator
+        # Moving devices by MAC address, as
+        # (device, target, last position, time movement started).
+        self._moving: dict[str, list] = {}
+        self._task: asyncio.Task | None = None
+
+    async def async_move(
+        self,
+        covers: list[FoxBaseCover],
+        action: str,
+        position: int | None = None,
+        tilt_position: int | None = None,
+    ) -> None:
+        """Send movement command to all covers in one burst."""
+        devices = [cover.device for cover in covers]
+        await self._device_coordinator.async_prepare_devices(devices)
+        if action == ACTION_OPEN:
+            command, args, target = "async_open_cover", (), 100
+        elif action == ACTION_CLOSE:
+            command, args, target = "async_close_cover", (), 0
+        elif action == ACTION_STOP:
+            command, args, target = "async_stop", (), None
+        elif tilt_position is not None:
+            command, args, target = (
+                "async_set_cover_and_tilt_positions", (position, tilt_position), position
+            )
+        else:
+            command, args, target = "async_set_cover_position", (position,), position
+        results = await asyncio.gather(
+            *(
+                self._device_coordinator.async_send_command(
+                    device, getattr(device, command), *args
+                )
+                for device in devices
+            ),
+            return_exceptions=True,
+        )
+        failed = []
+        for cover, device, result in zip(covers, devices, results):
+            if isinstance(result, Exception):
+                self._hass.bus.async_fire(
+                    EVENT_COMMAND_FAILED,
+                    {
+                        ATTR_ENTITY_ID: cover.entity_id,
+                        "mac_addr": device.mac_addr,
+                        "command": command,
+                        "args": list(args),
+                        "reason": repr(result),
+                    },
+                )
+                failed.append(cover.entity_id)
+                continue
+            self.track(device, target)
+        if failed:
+            raise HomeAssistantError(
+                f"F&F Fox covers did not accept {command}: {', '.join(failed)}"
+            )
+
+    @callback
+    def track(self, device, target: int | None) -> None:
+        """Fast poll device until it reaches target or stops."""
+        self._moving[device.mac_addr] = [device, target, None, time.monotonic()]
+        if self._task is None:
+            self._task = self._hass.async_create_background_task(
+                self._async_poll_moving(), "fandffox cover motion"
+            )
+
+    @callback
+    def cancel(self) -> None:
+        """Stop fast polling."""
+        self._moving.clear()
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    async def _async_poll_moving(self) -> None:
+        """Poll moving devices with one shared loop."""
+        try:
+            while self._moving:
+                await asyncio.sleep(MOTION_POLL_INTERVAL)
+                moving = list(self._moving.items())
+                await asyncio.gather(
+                    *(
+                        self._device_coordinator.async_confirm_device(device)
+                        for _, (device, *_) in moving
+                    ),
+                    return_exceptions=True,
+                )
+                now = time.monotonic()
+                for mac_addr, state in moving:
+                    device, target, last_position, started = state
+                    position = device.get_cover_position()
+                    # Device tracked again meanwhile keeps its new entry.
+                    if self._moving.get(mac_addr) is state and (
+                        position in (target, last_position)
+                        or now - started > MOTION_TIMEOUT
+                    ):
+                        del self._moving[mac_addr]
+                    state[2] = position
+                self._coordinator.async_update_listeners()
+        finally:
+            if self._task is asyncio.current_task():
+                self._task = None
+
+
+class FoxBaseCover(FoxEntity, CoverEntity):
+    """Fox base cover implementation."""
 
-    @property
-    def device_info(self):
-        """Return device info."""
-        return self.coordinator.data[self._idx].get_device_info()
+    def __init__(
+        self,
+        coordinator: DataUpdateCoordinator,
+        device_coordinator: FoxDevicesCoordinator,
+        idx: int,
+    ) -> None:
+        """Initialize object."""
+        super().__init__(coordinator, device_coordinator, idx)
+        self._pending_position: int | None = None
+        self._pending_tilt: int | None = None
+        self._pending_move: asyncio.Task | None = None
+        device = coordinator.data[idx]
+        self._attr_unique_id = f"{device.mac_addr}-{device.device_platform}"
 
     @property
     def supported_features(self):
@@ -140,49 +304,77 @@ class FoxBaseCover(CoordinatorEntity, CoverEntity):
 
     async def async_open_cover(self, **kwargs):
         """Open the cover."""
-        await self.coordinator.data[self._idx].async_open_cover()
-        await self.coordinator.async_request_refresh()
+        await self._async_wait_pending_move()
+        await self._async_deliver("async_open_cover")
 
     async def async_close_cover(self, **kwargs):
         """Close cover."""
-        await self.coordinator.data[self._idx].async_close_cover()
-        await self.coordinator.async_request_refresh()
+        await self._async_wait_pending_move()
+        await self._async_deliver("async_close_cover")
 
     async def async_set_cover_position(self, **kwargs):
         """Set cover position."""
         position = kwargs.get(ATTR_POSITION)
         if position is None:
             return
-        await self.coordinator.data[self._idx].async_set_cover_position(int(position))
-        await self.coordinator.async_request_refresh()
+        await self._async_move(position=int(position))
 
     async def async_set_cover_tilt_position(self, **kwargs):
         """Set cover tilt position."""
         position = kwargs.get(ATTR_TILT_POSITION)
         if position is None:
             return
-        await self.coordinator.data[self._idx].async_set_tilt_position(int(position))
-        await self.coordinator.async_request_refresh()
+        await self._async_move(tilt=int(position))
 
     async def async_stop_cover(self, **kwargs):
         """Stop cover movement."""
-        await self.coordinator.data[self._idx].async_stop()
-        await self.coordinator.async_request_refresh()
+        await self._async_wait_pending_move()
+        await self._async_deliver("async_stop")
+
+    async def _async_move(self, position: int | None = None, tilt: int | None = None):
+        """Request cover movement, merged with requests of merge window."""
+        if position is not None:
+            self._pending_position = position
+        if tilt is not None:
+            self._pending_tilt = tilt
+        if self._pending_move is None:
+            self._pending_move = self.hass.async_create_task(
+                self._async_send_pending_move()
+            )
+        await asyncio.shield(self._pending_move)
+
+    async def _async_wait_pending_move(self):
+        """Let pending movement be sent before next command."""
+        if self._pending_move is not None:
+            await asyncio.shield(self._pending_move)
+
+    async def _async_send_pending_move(self):
+        """Send pending position and tilt as single command."""
+        try:
+            await asyncio.sleep(POSITION_MERGE_WINDOW)
+        finally:
+            position, tilt = self._pending_position, self._pending_tilt
+            self._pending_position = self._pending_tilt = None
+            self._pending_move = None
+        if position is not None and tilt is not None:
+            await self._async_deliver("async_set_cover_and_tilt_positions", position, tilt)
+        elif position is not None:
+            await self._async_deliver("async_set_cover_position", position)
+        else:
+            await self._async_deliver("async_set_tilt_position", tilt)
 
     async def async_set_cover_and_tilt_positions_service(
         self, position: int, tilt_position: int
     ):
         """Set cover and tilt positions in one call."""
-        await self.coordinator.data[self._idx].async_set_cover_and_tilt_positions(
-            int(position), int(tilt_position)
+        await self._async_deliver(
+            "async_set_cover_and_tilt_positions", int(position), int(tilt_position)
         )
-        await self.coordinator.async_request_refresh()
 
     async def async_set_cover_position_with_blocking_service(
         self, position: int, blocking_time: int
     ):
         """Set cover position with blocking time."""
-        await self.coordinator.data[self._idx].async_set_cover_position_with_blocking(
-            int(position), int(blocking_time)
+        await self._async_deliver(
+            "async_set_cover_position_with_blocking", int(position), int(blocking_time)
         )
-        await self.coordinator.async_request_refresh()
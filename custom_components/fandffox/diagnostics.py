@@ -0,0 +1,27 @@
+"""Diagnostics support for F&F Fox devices."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from . import FoxDevicesCoordinator
+from .const import DOMAIN
+
+TO_REDACT = {"api_key"}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics of config entry."""
+    coordinator: FoxDevicesCoordinator = hass.data[DOMAIN][entry.entry_id]
+    return {
+        "entry": {
+            "data": async_redact_data(dict(entry.data), TO_REDACT),
+            "options": dict(entry.options),
+        },
+        "watchdog": coordinator.watchdog.as_dict(),
+    }
@@ -0,0 +1,247 @@
+"""Background tracking of F&F Fox devices addresses."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable, Iterable
+from contextlib import suppress
+from datetime import timedelta
+import ipaddress
+import logging
+import time
+from typing import TYPE_CHECKING
+
+from foxrestapiclient.devices.const import DEVICES
+from foxrestapiclient.devices.fox_base_device import DeviceData, FoxBaseDevice
+from foxrestapiclient.devices.fox_service_discovery import FoxServiceDiscovery
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import async_track_time_interval
+
+from .const import (
+    DEFAULT_CONNECT_TIMEOUT,
+    DEFAULT_REQUEST_RETRIES,
+    DEFAULT_REQUEST_TIMEOUT,
+    DEVICE_PORT,
+    REDISCOVERY_COOLDOWN,
+    REDISCOVERY_SCAN_INTERVAL,
+    REDISCOVERY_TRIES,
+    REDISCOVERY_TRY_INTERVAL,
+    SCAN_CONCURRENCY,
+)
+from .scheduler import async_call_with_retry
+
+if TYPE_CHECKING:
+    from . import FoxDevicesCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+
+async def async_probe_host(host: str, port: int, timeout: float) -> bool:
+    """Return True if TCP connection to host can be opened."""
+    try:
+        async with asyncio.timeout(timeout):
+            _, writer = await asyncio.open_connection(host, port)
+    except (asyncio.TimeoutError, OSError):
+        return False
+    writer.close()
+    with suppress(OSError):
+        await writer.wait_closed()
+    return True
+
+
+def parse_networks(value: str) -> list[ipaddress.IPv4Network]:
+    """Parse comma separated CIDR ranges, raise ValueError if invalid."""
+    return [
+        ipaddress.IPv4Network(network.strip(), strict=False)
+        for network in value.split(",")
+        if network.strip()
+    ]
+
+
+def count_hosts(networks: Iterable[ipaddress.IPv4Network]) -> int:
+    """Return upper bound of number of hosts of networks, without listing them."""
+    return sum(network.num_addresses for network in networks)
+
+
+def network_hosts(networks: Iterable[ipaddress.IPv4Network]) -> list[str]:
+    """Return unique host addresses of networks."""
+    hosts: dict[str, None] = {}
+    for network in networks:
+        for host in network.hosts():
+            hosts[str(host)] = None
+    return list(hosts)
+
+
+async def async_get_adapter_networks(hass: HomeAssistant) -> list[ipaddress.IPv4Network]:
+    """Return IPv4 networks of enabled network adapters."""
+    # Imported here, network integration is loaded only when adapters are swept.
+    from homeassistant.components import network  # pylint: disable=import-outside-toplevel
+
+    networks = []
+    for adapter in await network.async_get_adapters(hass):
+        if not adapter["enabled"]:
+            continue
+        for ip_info in adapter["ipv4"]:
+            networks.append(
+                ipaddress.IPv4Network(
+                    f"{ip_info['address']}/{ip_info['network_prefix']}", strict=False
+                )
+            )
+    return networks
+
+
+async def _async_identify_host(host: str, api_key: str) -> DeviceData | None:
+    """Return data of F&F Fox device answering at host, None otherwise."""
+    device_data = DeviceData(None, host, api_key, None, None)
+    try:
+        # Client may reject device of unknown type already on creation.
+        device = FoxBaseDevice(device_data)
+        fetched = await async_call_with_retry(
+            device.async_fetch_device_info, DEFAULT_REQUEST_TIMEOUT, DEFAULT_REQUEST_RETRIES
+        )
+    except Exception as err:  # pylint: disable=broad-except
+        # Any web server may answer on swept hosts, not only F&F Fox devices.
+        _LOGGER.debug("Host %s is not F&F Fox device: %s", host, err)
+        return None
+    dev_type = getattr(device, "dev_type", None)
+    if fetched is False or not device.mac_addr or dev_type not in DEVICES:
+        return None
+    return DeviceData(device.name, host, api_key, device.mac_addr, dev_type)
+
+
+async def async_sweep_hosts(
+    hosts: list[str],
+    api_key: str,
+    rate: float,
+    connect_timeout: float = DEFAULT_CONNECT_TIMEOUT,
+) -> list[DeviceData]:
+    """Probe hosts by unicast and return F&F Fox devices found.
+
+    Connections are started at most at given rate per second, with limited
+    number of them in progress, so IoT networks are not flooded.
+    """
+    semaphore = asyncio.Semaphore(SCAN_CONCURRENCY)
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+
+    async def _async_probe(index: int, host: str) -> DeviceData | None:
+        await asyncio.sleep(max(0, started + index / rate - loop.time()))
+        async with semaphore:
+            if not await async_probe_host(host, DEVICE_PORT, connect_timeout):
+                return None
+            return await _async_identify_host(host, api_key)
+
+    results = await asyncio.gather(
+        *(_async_probe(index, host) for index, host in enumerate(hosts))
+    )
+    return [device_data for device_data in results if device_data is not None]
+
+
+def merge_devices(*results: Iterable[DeviceData]) -> list[DeviceData]:
+    """Merge discovery results by MAC address, first result wins."""
+    devices: dict[str, DeviceData] = {}
+    for result in results:
+        for device_data in result:
+            devices.setdefault(device_data.mac_addr, device_data)
+    return list(devices.values())
+
+
+class FoxDeviceTracker:
+    """Keep MAC to IP address table of configured devices up to date."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: ConfigEntry,
+        coordinator: FoxDevicesCoordinator,
+    ) -> None:
+        """Initialize object."""
+        self._hass = hass
+        self._entry = entry
+        self._coordinator = coordinator
+        self._discovery = FoxServiceDiscovery()
+        self._hosts: dict[str, str] = {}
+        self._lock = asyncio.Lock()
+        self._last_scan = 0.0
+        self._task: asyncio.Task | None = None
+
+    @property
+    def hosts(self) -> dict[str, str]:
+        """Return last known MAC to IP address table."""
+        return dict(self._hosts)
+
+    @callback
+    def async_start(self) -> Callable[[], None]:
+        """Start tracking. Return callback which stops it."""
+        self._coordinator.on_device_unavailable = self._async_device_unavailable
+        unsub = async_track_time_interval(
+            self._hass,
+            self._async_scheduled_scan,
+            timedelta(seconds=REDISCOVERY_SCAN_INTERVAL),
+        )
+
+        @callback
+        def _async_stop() -> None:
+            unsub()
+            self._coordinator.on_device_unavailable = None
+            if self._task is not None:
+                self._task.cancel()
+
+        return _async_stop
+
+    @callback
+    def _async_scheduled_scan(self, _now) -> None:
+        """Run periodic scan."""
+        self._async_schedule_scan()
+
+    @callback
+    def _async_device_unavailable(self, device: FoxBaseDevice) -> None:
+        """Re-resolve device address once it becomes unavailable."""
+        if time.monotonic() - self._last_scan < REDISCOVERY_COOLDOWN:
+            return
+        _LOGGER.debug("F&F Fox device %s unavailable, resolving.", device.mac_addr)
+        self._async_schedule_scan()
+
+    @callback
+    def _async_schedule_scan(self) -> None:
+        """Start scan task unless one is running."""
+        if self._task is not None and not self._task.done():
+            return
+        self._task = self._hass.async_create_background_task(
+            self.async_scan(), f"{self._entry.domain} rediscovery"
+        )
+
+    async def async_scan(self) -> None:
+        """Discover devices and re-point moved ones."""
+        async with self._lock:
+            self._last_scan = time.monotonic()
+            try:
+                discovered = await self._discovery.async_discover_devices(
+                    default_tries=REDISCOVERY_TRIES, interval=REDISCOVERY_TRY_INTERVAL
+                )
+            except OSError as err:
+                _LOGGER.debug("F&F Fox rediscovery failed: %s", err)
+                return
+            moved: dict[str, str] = {}
+            for device_data in discovered:
+                self._hosts[device_data.mac_addr] = device_data.host
+                if self._coordinator.update_device_host(
+                    device_data.mac_addr, device_data.host
+                ):
+                    moved[device_data.mac_addr] = device_data.host
+            if moved:
+                self._async_store_hosts(moved)
+
+    @callback
+    def _async_store_hosts(self, moved: dict[str, str]) -> None:
+        """Persist new hosts of moved devices in config entry."""
+        devices = []
+        for device_config in self._entry.data["discovered_devices"]:
+            device_config = dict(device_config)
+            if device_config.get("mac_addr") in moved:
+                device_config["host"] = moved[device_config["mac_addr"]]
+            devices.append(device_config)
+        self._hass.config_entries.async_update_entry(
+            self._entry, data={**self._entry.data, "discovered_devices": devices}
+        )
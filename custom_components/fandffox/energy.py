@@ -0,0 +1,116 @@
+"""Long term statistics of F&F Fox R1S1 energy counters."""
+from __future__ import annotations
+
+from collections.abc import Callable
+from datetime import datetime, timedelta
+import logging
+from typing import TYPE_CHECKING
+
+from homeassistant.components.recorder import get_instance
+from homeassistant.components.recorder.models import StatisticData, StatisticMetaData
+from homeassistant.components.recorder.statistics import (
+    async_add_external_statistics,
+    get_last_statistics,
+)
+from homeassistant.const import UnitOfEnergy
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import async_track_utc_time_change
+from homeassistant.util import dt as dt_util, slugify
+
+from .const import DOMAIN
+
+if TYPE_CHECKING:
+    from . import FoxDevicesCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+# Cumulative R1S1 counters imported as statistics, with their units.
+ENERGY_COUNTERS: dict[str, str] = {
+    "active_energy": UnitOfEnergy.WATT_HOUR,
+    "active_energy_import": UnitOfEnergy.WATT_HOUR,
+    "reactive_energy": "varh",
+    "reactive_energy_import": "varh",
+}
+
+
+def statistic_id(mac_addr: str, key: str) -> str:
+    """Return external statistic id of device counter."""
+    return f"{DOMAIN}:{slugify(mac_addr)}_{key}"
+
+
+class FoxEnergyStatistics:
+    """Import hourly statistics of R1S1 energy counters in bulk."""
+
+    def __init__(
+        self, hass: HomeAssistant, device_coordinator: FoxDevicesCoordinator
+    ) -> None:
+        """Initialize object."""
+        self._hass = hass
+        self._device_coordinator = device_coordinator
+        # Last imported (state, sum) by statistic id.
+        self._last: dict[str, tuple[float, float]] = {}
+        # Rows of current hour by statistic id, imported together.
+        self._pending: dict[str, list[StatisticData]] = {}
+        self._metadata: dict[str, StatisticMetaData] = {}
+
+    @callback
+    def start(self) -> Callable[[], None]:
+        """Start hourly import. Return callback which stops it."""
+        return async_track_utc_time_change(
+            self._hass, self._async_hour_passed, minute=0, second=10
+        )
+
+    async def _async_hour_passed(self, now: datetime) -> None:
+        """Import counters readings at the end of last hour."""
+        start = dt_util.as_utc(now).replace(
+            minute=0, second=0, microsecond=0
+        ) - timedelta(hours=1)
+        for device in self._device_coordinator.get_sensor_devices():
+            # Only fresh readings close the hour, stale ones would shift usage.
+            if self._device_coordinator.get_data_age(device) != 0:
+                continue
+            for key, unit in ENERGY_COUNTERS.items():
+                value = device.fetch_sensor_value_by_key(key)
+                if value is None:
+                    continue
+                await self._async_add_row(device, key, unit, start, float(value))
+        for stat_id, rows in self._pending.items():
+            if rows:
+                _LOGGER.debug("Importing %d rows of %s statistics.", len(rows), stat_id)
+                async_add_external_statistics(self._hass, self._metadata[stat_id], rows)
+        self._pending.clear()
+
+    async def _async_add_row(
+        self, device, key: str, unit: str, start: datetime, state: float
+    ) -> None:
+        """Queue statistics row of device counter."""
+        stat_id = statistic_id(device.mac_addr, key)
+        if stat_id not in self._metadata:
+            self._metadata[stat_id] = StatisticMetaData(
+                has_mean=False,
+                has_sum=True,
+                name=f"{device.name or device.mac_addr} {key.replace('_', ' ')}",
+                source=DOMAIN,
+                statistic_id=stat_id,
+                unit_of_measurement=unit,
+            )
+            self._last[stat_id] = await self._async_get_last(stat_id, state)
+        last_state, last_sum = self._last[stat_id]
+        # Counter restarted from zero (e.g. device reset), count from there.
+        growth = state - last_state if state >= last_state else state
+        row_sum = last_sum + growth
+        self._last[stat_id] = (state, row_sum)
+        self._pending.setdefault(stat_id, []).append(
+            StatisticData(start=start, state=state, sum=row_sum)
+        )
+
+    async def _async_get_last(self, stat_id: str, state: float) -> tuple[float, float]:
+        """Return last imported (state, sum) of statistic."""
+        last = await get_instance(self._hass).async_add_executor_job(
+            get_last_statistics, self._hass, 1, stat_id, True, {"state", "sum"}
+        )
+        if not last.get(stat_id):
+            # First import, usage is counted from current reading.
+            return state, 0.0
+        row = last[stat_id][0]
+        return row.get("state") or 0.0, row.get("sum") or 0.0
@@ -0,0 +1,198 @@
+"""Base entity for F&F Fox devices."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from functools import partial
+import logging
+from typing import TYPE_CHECKING
+
+from foxrestapiclient.devices.fox_base_device import FoxBaseDevice
+
+from .const import (
+    ATTR_DATA_AGE,
+    COMMAND_DELIVERY_ATTEMPTS,
+    COMMAND_RETRY_DELAY,
+    EVENT_COMMAND_FAILED,
+)
+from .scheduler import RETRY_ERRORS
+from .watchdog import SECTION_STATE_WRITE
+from homeassistant.const import ATTR_ENTITY_ID
+from homeassistant.core import callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.update_coordinator import (
+    CoordinatorEntity,
+    DataUpdateCoordinator,
+)
+
+if TYPE_CHECKING:
+    from . import FoxDevicesCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class FoxEntity(CoordinatorEntity):
+    """Fox entity bound to device at given index of coordinator data."""
+
+    # Channel of device controlled by entity, if any.
+    _channel: int | None = None
+
+    def __init__(
+        self,
+        coordinator: DataUpdateCoordinator,
+        device_coordinator: FoxDevicesCoordinator,
+        idx: int,
+    ) -> None:
+        """Initialize object."""
+        super().__init__(coordinator)
+        self._device_coordinator = device_coordinator
+        self._idx = idx
+        self._update_static_attributes()
+
+    @property
+    def device(self):
+        """Return device of this entity."""
+        return self.coordinator.data[self._idx]
+
+    @property
+    def available(self):
+        """Return True if entity is available."""
+        return self._device_coordinator.is_device_available(
+            self.coordinator.data[self._idx]
+        )
+
+    @property
+    def extra_state_attributes(self):
+        """Return age of served device state."""
+        return {
+            ATTR_DATA_AGE: self._device_coordinator.get_data_age(
+                self.coordinator.data[self._idx]
+            )
+        }
+
+    def _static_name(self, device: FoxBaseDevice) -> str:
+        """Return entity name built from static device info."""
+        return device.name
+
+    def _update_static_attributes(self) -> None:
+        """Set attributes which come from static device info."""
+        device = self.coordinator.data[self._idx]
+        self._attr_name = self._static_name(device)
+        self._attr_device_info = device.get_device_info()
+
+    async def async_added_to_hass(self) -> None:
+        """Follow refreshes of static device info."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self._device_coordinator.add_info_listener(
+                self.coordinator.data[self._idx].mac_addr,
+                self._async_device_info_updated,
+            )
+        )
+
+    @callback
+    def _async_device_info_updated(self) -> None:
+        """Update entity after static device info was refreshed."""
+        self._update_static_attributes()
+        self.async_write_ha_state()
+
+    @callback
+    def async_write_ha_state(self) -> None:
+        """Write entity state, timed by stall watchdog."""
+        with self._device_coordinator.watchdog.measure(
+            SECTION_STATE_WRITE, self.entity_id
+        ):
+            super().async_write_ha_state()
+
+    async def _async_confirm(self) -> None:
+        """Read back device state after commands and update entities."""
+        try:
+            await self._device_coordinator.async_confirm_device(
+                self.coordinator.data[self._idx]
+            )
+        except RETRY_ERRORS as err:
+            self._async_delivery_failed("read back", (), repr(err))
+        finally:
+            self.coordinator.async_update_listeners()
+
+    async def _async_deliver(
+        self,
+        command: str,
+        *args,
+        verify: Callable[[FoxBaseDevice], bool] | None = None,
+    ) -> None:
+        """Send command confirmed by read-back of the device."""
+        device = self.coordinator.data[self._idx]
+
+        async def _async_send() -> None:
+            await self._device_coordinator.async_send_command(
+                device, getattr(device, command), *args
+            )
+            await self._device_coordinator.async_confirm_device(device)
+
+        await self._async_deliver_attempts(command, args, _async_send, verify)
+
+    async def _async_deliver_channel_state(self, state: bool) -> None:
+        """Set state of entity channel, batched with other channels of device."""
+        device = self.coordinator.data[self._idx]
+        await self._async_deliver_attempts(
+            "async_update_channel_state",
+            (state, self._channel),
+            partial(
+                self._device_coordinator.async_set_channel_state,
+                device,
+                self._channel,
+                state,
+            ),
+            lambda device: device.is_on(self._channel) is state,
+        )
+
+    async def _async_deliver_attempts(
+        self,
+        command: str,
+        args: tuple,
+        send: Callable[[], Awaitable[None]],
+        verify: Callable[[FoxBaseDevice], bool] | None,
+    ) -> None:
+        """Send command and read device back until it is confirmed.
+
+        Command is sent again while it fails or read-back state does not
+        match, within delivery attempts.
+        """
+        device = self.coordinator.data[self._idx]
+        for attempt in range(COMMAND_DELIVERY_ATTEMPTS):
+            if attempt:
+                await asyncio.sleep(COMMAND_RETRY_DELAY)
+            try:
+                await send()
+            except RETRY_ERRORS as err:
+                reason = repr(err)
+            else:
+                if verify is None or verify(device):
+                    self.coordinator.async_update_listeners()
+                    return
+                reason = "state not confirmed by device"
+            _LOGGER.debug(
+                "F&F Fox %s delivery to %s failed: %s", command, device.mac_addr, reason
+            )
+        self.coordinator.async_update_listeners()
+        self._async_delivery_failed(command, args, reason)
+
+    @callback
+    def _async_delivery_failed(self, command: str, args: tuple, reason: str) -> None:
+        """Report failed command, raise error shown to the caller."""
+        device = self.coordinator.data[self._idx]
+        self.hass.bus.async_fire(
+            EVENT_COMMAND_FAILED,
+            {
+                ATTR_ENTITY_ID: self.entity_id,
+                "mac_addr": device.mac_addr,
+                "command": command,
+                "args": list(args),
+                "reason": reason,
+            },
+        )
+        raise HomeAssistantError(
+            f"F&F Fox device {device.name or device.mac_addr} did not confirm "
+            f"{command}: {reason}"
+        )
@@ -1,26 +1,86 @@
 """Platform for light integration."""
+import asyncio
 from datetime import timedelta
 import logging
+import math
+import time
 
-from foxrestapiclient.devices.fox_dim1s2_device import FoxDIM1S2Device
-from foxrestapiclient.devices.fox_led2s2_device import FoxLED2S2Device
-from foxrestapiclient.devices.fox_rgbw_device import FoxRGBWDevice
+from foxrestapiclient.devices.const import (
+    DEVICE_MODEL_DIM1S2,
+    DEVICE_MODEL_LED2S2,
+    DEVICE_MODEL_RGBW,
+)
 
 from . import FoxDevicesCoordinator
 from .const import DOMAIN, POOLING_INTERVAL, SCHEMA_INPUT_UPDATE_POOLING
+from .entity import FoxEntity
 from homeassistant.components.light import (
     ATTR_BRIGHTNESS,
     ATTR_HS_COLOR,
+    ATTR_TRANSITION,
     ColorMode,
     LightEntityFeature,
     LightEntity,
 )
-from homeassistant.helpers.update_coordinator import (
-    CoordinatorEntity,
-    DataUpdateCoordinator,
-)
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
 _LOGGER = logging.getLogger(__name__)
+# Minimal time (in seconds) between brightness commands of a transition.
+TRANSITION_MIN_STEP_INTERVAL = 0.5
+# Maximal change of perceived lightness (CIE L*, 0-100) of a transition step.
+TRANSITION_MAX_LIGHTNESS_STEP = 4
+
+
+def _lightness(brightness: float) -> float:
+    """Convert brightness (0-255) to perceived lightness (0-100)."""
+    luminance = brightness / 255
+    if luminance <= 0.008856:
+        return 903.3 * luminance
+    return 116 * luminance ** (1 / 3) - 16
+
+
+def _brightness(lightness: float) -> int:
+    """Convert perceived lightness (0-100) to brightness (1-255)."""
+    if lightness <= 8:
+        luminance = lightness / 903.3
+    else:
+        luminance = ((lightness + 16) / 116) ** 3
+    return max(1, min(255, round(luminance * 255)))
+
+
+def transition_steps(
+    start: int, target: int, transition: float
+) -> list[tuple[float, int]]:
+    """Return fewest (time offset, brightness) steps of smooth transition.
+
+    Steps are evenly spaced in perceived lightness, so each one is equally
+    noticeable, and no closer in time than device requests allow.
+    """
+    start_lightness = _lightness(start)
+    target_lightness = _lightness(target)
+    steps = max(
+        1,
+        min(
+            math.ceil(
+                abs(target_lightness - start_lightness) / TRANSITION_MAX_LIGHTNESS_STEP
+            ),
+            int(transition / TRANSITION_MIN_STEP_INTERVAL),
+        ),
+    )
+    result: list[tuple[float, int]] = []
+    for step in range(1, steps + 1):
+        if step == steps:
+            brightness = max(target, 1)
+        else:
+            brightness = _brightness(
+                start_lightness + (target_lightness - start_lightness) * step / steps
+            )
+        if result and result[-1][1] == brightness:
+            continue
+        offset = 0.0 if steps == 1 else transition * (step - 1) / (steps - 1)
+        result.append((offset, brightness))
+    return result
 
 
 async def async_setup_entry(hass, config_entry, async_add_entities):
@@ -54,93 +114,149 @@ async def async_setup_entry(hass, config_entry, async_add_entities):
 
     await coordinator.async_config_entry_first_refresh()
     for idx, ent in enumerate(coordinator.data):
-        if isinstance(ent, FoxLED2S2Device):
+        model = device_coordinator.get_device_model(ent)
+        if model == DEVICE_MODEL_LED2S2:
             for channel in ent.channels:
-                entities.append(FoxLED2S2Light(coordinator, idx, channel))
-        elif isinstance(ent, FoxDIM1S2Device):
-            entities.append(FoxDIM1S2Light(coordinator, idx, 1))
-        elif isinstance(ent, FoxRGBWDevice):
-            entities.append(FoxRGBWLight(coordinator, idx, 1))
+                entities.append(
+                    FoxLED2S2Light(coordinator, device_coordinator, idx, channel)
+                )
+        elif model == DEVICE_MODEL_DIM1S2:
+            entities.append(FoxDIM1S2Light(coordinator, device_coordinator, idx, 1))
+        elif model == DEVICE_MODEL_RGBW:
+            entities.append(FoxRGBWLight(coordinator, device_coordinator, idx, 1))
 
     async_add_entities(entities)
     return True
 
 
-class FoxBaseLight(CoordinatorEntity, LightEntity):
+class FoxBaseLight(FoxEntity, LightEntity):
     """Fox base light implementation."""
 
-    def __init__(self, coordinator, idx, channel=None) -> None:
+    def __init__(self, coordinator, device_coordinator, idx, channel=None) -> None:
         """Initialize object."""
-        super().__init__(coordinator)
-        self._idx = idx
+        super().__init__(coordinator, device_coordinator, idx)
         self._channel = channel
-
-    @property
-    def name(self):
-        """Return the name of the device."""
-        return self.coordinator.data[self._idx].name
+        self._transition: asyncio.Task | None = None
+        # Brightness before light was faded out, restored on next turn on.
+        self._restore_brightness: int | None = None
+        device = coordinator.data[idx]
+        self._attr_unique_id = f"{device.mac_addr}-{device.device_platform}-{channel}"
 
     @property
     def is_on(self):
         """Return is on value."""
         return self.coordinator.data[self._idx].is_on(self._channel)
 
-    @property
-    def available(self):
-        """Return True if entity is available."""
-        return self.coordinator.data[self._idx].is_available
-
-    @property
-    def unique_id(self) -> str:
-        """Return a unique ID."""
-        device = self.coordinator.data[self._idx]
-        return f"{device.mac_addr}-{device.device_platform}-{self._channel}"
-
-    @property
-    def device_info(self):
-        """Return device info."""
-        return self.coordinator.data[self._idx].get_device_info()
-
     @property
     def should_poll(self):
         """Return the polling state. Polling is needed."""
         return True
 
+    async def async_will_remove_from_hass(self) -> None:
+        """Cancel running transition."""
+        self._cancel_transition()
+        await super().async_will_remove_from_hass()
+
     async def async_turn_on(self, **kwargs) -> None:
         """Turn on light."""
-        if self.coordinator.data[self._idx].is_on(self._channel) is False:
-            await self.coordinator.data[self._idx].async_update_channel_state(
-                True, self._channel
-            )
-        if kwargs == {}:
-            await self.coordinator.async_request_refresh()
-            return
-        if ATTR_BRIGHTNESS in kwargs:
-            await self.coordinator.data[self._idx].async_update_channel_brightness(
-                kwargs[ATTR_BRIGHTNESS], self._channel
-            )
-        await self.coordinator.async_request_refresh()
+        self._cancel_transition()
+        if self._restore_brightness is not None and ATTR_BRIGHTNESS not in kwargs:
+            kwargs[ATTR_BRIGHTNESS] = self._restore_brightness
+        self._restore_brightness = None
+        transition = kwargs.pop(ATTR_TRANSITION, None)
+        if transition:
+            start = (self.brightness or 0) if self.is_on else 0
+            target = kwargs.pop(ATTR_BRIGHTNESS, None)
+            if target is None and not self.is_on:
+                target = self.brightness or 255
+            if target is not None and target != start:
+                self._transition = self.hass.async_create_task(
+                    self._async_transition(
+                        transition_steps(start, target, transition), kwargs
+                    )
+                )
+                return
+        await self._async_turn_on(kwargs)
 
     async def async_turn_off(self, **kwargs) -> None:
         """Turn off light."""
-        if self.coordinator.data[self._idx].is_on(self._channel) is True:
-            await self.coordinator.data[self._idx].async_update_channel_state(
-                False, self._channel
+        self._cancel_transition()
+        transition = kwargs.get(ATTR_TRANSITION)
+        if transition and self.is_on and self.brightness:
+            self._transition = self.hass.async_create_task(
+                self._async_transition(
+                    transition_steps(self.brightness, 0, transition), None
+                )
             )
-        await self.coordinator.async_request_refresh()
+            return
+        if self.coordinator.data[self._idx].is_on(self._channel) is True:
+            await self._async_deliver_channel_state(False)
+            return
+        await self._async_confirm()
+
+    async def _async_turn_on(self, kwargs: dict, confirm: bool = True) -> None:
+        """Turn on light and apply attributes, each confirmed by read-back."""
+        if self.coordinator.data[self._idx].is_on(self._channel) is False:
+            await self._async_deliver_channel_state(True)
+        elif ATTR_BRIGHTNESS not in kwargs and confirm:
+            await self._async_confirm()
+        if ATTR_BRIGHTNESS in kwargs:
+            await self._async_send_brightness(kwargs[ATTR_BRIGHTNESS])
+
+    async def _async_send_brightness(self, brightness: int) -> None:
+        """Send brightness (0-255) to the device."""
+        await self._async_deliver(
+            "async_update_channel_brightness",
+            brightness,
+            self._channel,
+            verify=lambda _device: self.brightness == brightness,
+        )
+
+    def _cancel_transition(self) -> None:
+        """Cancel running transition, later commands take over."""
+        if self._transition is not None:
+            self._transition.cancel()
+            self._transition = None
+
+    async def _async_transition(
+        self, steps: list[tuple[float, int]], turn_on_kwargs: dict | None
+    ) -> None:
+        """Send transition steps, turn on after first or turn off after last."""
+        start_brightness = self.brightness
+        started = time.monotonic()
+        try:
+            for step, (offset, brightness) in enumerate(steps):
+                delay = started + offset - time.monotonic()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                await self._async_send_brightness(brightness)
+                if step == 0 and turn_on_kwargs is not None:
+                    await self._async_turn_on(turn_on_kwargs, confirm=False)
+            if turn_on_kwargs is None:
+                await self._async_deliver_channel_state(False)
+                self._restore_brightness = start_brightness
+        except HomeAssistantError as err:
+            # Transition runs in background, nobody awaits its errors.
+            _LOGGER.warning("F&F Fox %s transition failed: %s", self.entity_id, err)
+        self._transition = None
 
 
 class FoxDimmableLight(FoxBaseLight):
     """Fox dimmable light implementation."""
 
-    def __init__(self, coordinator, idx, channel) -> None:
+    def __init__(self, coordinator, device_coordinator, idx, channel) -> None:
         """Initialize object."""
-        super().__init__(coordinator, idx, channel=channel)
+        super().__init__(coordinator, device_coordinator, idx, channel=channel)
 
     @property
     def supported_features(self):
         """Return supported features."""
-        return LightEntityFeature.BRIGHTNESS
+        return LightEntityFeature.TRANSITION
+
+    @property
+    def supported_color_modes(self):
+        """Return supported color modes."""
+        return {ColorMode.BRIGHTNESS}
 
     @property
     def color_mode(self):
@@ -151,9 +267,9 @@ class FoxDimmableLight(FoxBaseLight):
 class FoxLED2S2Light(FoxDimmableLight):
     """Fox led2s2 light implementation."""
 
-    def __init__(self, coordinator, idx, channel) -> None:
+    def __init__(self, coordinator, device_coordinator, idx, channel) -> None:
         """Initialize object."""
-        super().__init__(coordinator, idx, channel=channel)
+        super().__init__(coordinator, device_coordinator, idx, channel=channel)
 
     @property
     def brightness(self):
@@ -166,9 +282,9 @@ class FoxLED2S2Light(FoxDimmableLight):
 class FoxDIM1S2Light(FoxDimmableLight):
     """Fox dim1s2 light implementation."""
 
-    def __init__(self, coordinator, idx, channel=None) -> None:
+    def __init__(self, coordinator, device_coordinator, idx, channel=None) -> None:
         """Initialize object."""
-        super().__init__(coordinator, idx, channel=channel)
+        super().__init__(coordinator, device_coordinator, idx, channel=channel)
 
     @property
     def brightness(self):
@@ -184,14 +300,21 @@ class FoxDIM1S2Light(FoxDimmableLight):
 class FoxRGBWLight(FoxBaseLight):
     """Fox rgbw light implementation."""
 
-    def __init__(self, coordinator, idx, channel=None) -> None:
+    def __init__(self, coordinator, device_coordinator, idx, channel=None) -> None:
         """Initialize object."""
-        super().__init__(coordinator, idx, channel=channel)
+        super().__init__(coordinator, device_coordinator, idx, channel=channel)
+        # Last sent values as (value, state reported after sending).
+        self._last_sent: dict[str, tuple] = {}
 
     @property
     def supported_features(self):
         """Return supported features."""
-        return LightEntityFeature.BRIGHTNESS | LightEntityFeature.COLOR
+        return LightEntityFeature.TRANSITION
+
+    @property
+    def supported_color_modes(self):
+        """Return supported color modes."""
+        return {ColorMode.HS}
 
     @property
     def brightness(self):
@@ -208,22 +331,79 @@ class FoxRGBWLight(FoxBaseLight):
         """Return the color mode of the light."""
         return ColorMode.HS
 
-    async def async_turn_on(self, **kwargs) -> None:
-        """Turn on device."""
+    async def _async_turn_on(self, kwargs: dict, confirm: bool = True) -> None:
+        """Turn on device.
+
+        State, color and brightness are folded into the fewest commands:
+        values already sent and still reported by the device are skipped.
+        """
+        delivered = False
         if self.coordinator.data[self._idx].is_on(self._channel) is False:
-            await self.coordinator.data[self._idx].async_update_channel_state(
-                True, self._channel
-            )
-        if kwargs == {}:
-            await self.coordinator.async_request_refresh()
-            return
+            await self._async_deliver_channel_state(True)
+            delivered = True
+        sent = {}
         if ATTR_HS_COLOR in kwargs:
             hs = kwargs[ATTR_HS_COLOR]
             # Hue minus 1 because Fox RGBW device supports hue in range 0 - 359
-            await self.coordinator.data[self._idx].async_set_color_hsv(hs[0] - 1, hs[1])
-        elif ATTR_BRIGHTNESS in kwargs:
-            await self.coordinator.data[self._idx].async_set_brightness(
-                (kwargs[ATTR_BRIGHTNESS] / 255)
-                * 100  # Fox RGBW light supports brightness from 0 to 100
+            color = (max(hs[0] - 1, 0), hs[1])
+            if not self._is_sent(ATTR_HS_COLOR, color):
+                await self._async_deliver(
+                    "async_set_color_hsv",
+                    *color,
+                    verify=lambda _device: self._reports(ATTR_HS_COLOR, color),
+                )
+                sent[ATTR_HS_COLOR] = color
+        if ATTR_BRIGHTNESS in kwargs:
+            # Fox RGBW light supports brightness from 0 to 100
+            brightness = (kwargs[ATTR_BRIGHTNESS] / 255) * 100
+            if not self._is_sent(ATTR_BRIGHTNESS, brightness):
+                await self._async_deliver_brightness(brightness)
+                sent[ATTR_BRIGHTNESS] = brightness
+        if not delivered and not sent and confirm:
+            await self._async_confirm()
+        # Remember sent values together with state reported after them.
+        for key, value in sent.items():
+            self._last_sent[key] = (value, self._reported(key))
+
+    async def async_turn_off(self, **kwargs) -> None:
+        """Turn off device."""
+        self._last_sent.clear()
+        await super().async_turn_off(**kwargs)
+
+    async def _async_send_brightness(self, brightness: int) -> None:
+        """Send brightness (0-255) to the device."""
+        self._last_sent.pop(ATTR_BRIGHTNESS, None)
+        # Fox RGBW light supports brightness from 0 to 100
+        await self._async_deliver_brightness((brightness / 255) * 100)
+
+    async def _async_deliver_brightness(self, brightness: float) -> None:
+        """Send brightness (0-100) confirmed by read-back."""
+        await self._async_deliver(
+            "async_set_brightness",
+            brightness,
+            verify=lambda _device: self._reports(ATTR_BRIGHTNESS, brightness),
+        )
+
+    def _reported(self, key: str):
+        """Return value of key reported by the device."""
+        return self.hs_color if key == ATTR_HS_COLOR else self.brightness
+
+    def _reports(self, key: str, value) -> bool:
+        """Return True if device reports value sent to it."""
+        current = self._reported(key)
+        if current is None:
+            return False
+        # Device keeps whole numbers only.
+        if key == ATTR_HS_COLOR:
+            return all(
+                math.isclose(reported, sent, abs_tol=1)
+                for reported, sent in zip(current, value)
             )
-        await self.coordinator.async_request_refresh()
+        return math.isclose(current, value, abs_tol=1)
+
+    def _is_sent(self, key: str, value) -> bool:
+        """Return True if value was sent and device still reports it."""
+        if key not in self._last_sent:
+            return False
+        sent, reported = self._last_sent[key]
+        return sent == value and reported == self._reported(key)
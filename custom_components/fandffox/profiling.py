@@ -0,0 +1,94 @@
+"""On demand profiling of F&F Fox integration."""
+from __future__ import annotations
+
+import asyncio
+import cProfile
+import io
+import logging
+import pstats
+import time
+
+import voluptuous as vol
+
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
+from homeassistant.exceptions import HomeAssistantError
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+SERVICE_PROFILE = "profile"
+ATTR_DURATION = "duration"
+PROFILE_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_DURATION, default=60): vol.All(
+            vol.Coerce(float), vol.Range(min=1, max=3600)
+        ),
+    }
+)
+# Modules kept in summary of slowest calls.
+PROFILE_FILTER = r"fandffox|foxrestapiclient"
+# Number of calls listed in summary.
+PROFILE_SUMMARY_LINES = 40
+
+_PROFILE_LOCK = asyncio.Lock()
+
+
+def _write_profile(profiler: cProfile.Profile, path: str, duration: float) -> None:
+    """Write profile and summary of slowest calls (blocking)."""
+    profiler.dump_stats(f"{path}.prof")
+    summary = io.StringIO()
+    summary.write(f"F&F Fox profile of {duration:.0f} seconds\n")
+    for sort_key in (pstats.SortKey.CUMULATIVE, pstats.SortKey.TIME):
+        stats = pstats.Stats(profiler, stream=summary)
+        stats.sort_stats(sort_key).print_stats(PROFILE_FILTER, PROFILE_SUMMARY_LINES)
+    with open(f"{path}.txt", "w", encoding="utf-8") as file:
+        file.write(summary.getvalue())
+
+
+async def async_profile(hass: HomeAssistant, duration: float) -> str:
+    """Profile event loop for given time, return path of written files."""
+    if _PROFILE_LOCK.locked():
+        raise HomeAssistantError("F&F Fox profiling is already running")
+    async with _PROFILE_LOCK:
+        profiler = cProfile.Profile()
+        try:
+            # Poll cycles, entity state writes and commands all run in the
+            # event loop thread, which is the thread profiled here.
+            profiler.enable()
+        except ValueError as err:
+            raise HomeAssistantError(f"Unable to start profiling: {err}") from err
+        try:
+            await asyncio.sleep(duration)
+        finally:
+            profiler.disable()
+        path = hass.config.path(f"{DOMAIN}_profile_{int(time.time())}")
+        await hass.async_add_executor_job(_write_profile, profiler, path, duration)
+    _LOGGER.info("F&F Fox profile written to %s.prof and %s.txt", path, path)
+    return path
+
+
+@callback
+def async_register_profile_service(hass: HomeAssistant) -> None:
+    """Register profile service unless registered already."""
+    if hass.services.has_service(DOMAIN, SERVICE_PROFILE):
+        return
+
+    async def _async_profile(call: ServiceCall) -> ServiceResponse:
+        """Run profiler."""
+        path = await async_profile(hass, call.data[ATTR_DURATION])
+        return {"profile": f"{path}.prof", "summary": f"{path}.txt"}
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_PROFILE,
+        _async_profile,
+        schema=PROFILE_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
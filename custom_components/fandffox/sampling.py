@@ -0,0 +1,123 @@
+"""High rate power sampling of F&F Fox R1S1 devices."""
+from __future__ import annotations
+
+from array import array
+import asyncio
+import logging
+import time
+from typing import TYPE_CHECKING
+
+from homeassistant.core import HomeAssistant, callback
+
+if TYPE_CHECKING:
+    from . import FoxDevicesCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+# Key of sampled measurement.
+POWER_KEY = "power_active"
+
+
+class PowerSampleBuffer:
+    """Fixed size ring buffer of (timestamp, value) samples."""
+
+    def __init__(self, size: int) -> None:
+        """Initialize object."""
+        self._size = size
+        self._times = array("d", bytes(8 * size))
+        self._values = array("d", bytes(8 * size))
+        self._next = 0
+        self._count = 0
+
+    def __len__(self) -> int:
+        """Return number of stored samples."""
+        return self._count
+
+    def append(self, timestamp: float, value: float) -> None:
+        """Store sample, overwriting the oldest one when full."""
+        self._times[self._next] = timestamp
+        self._values[self._next] = value
+        self._next = (self._next + 1) % self._size
+        self._count = min(self._count + 1, self._size)
+
+    def _indexes(self):
+        """Yield indexes of samples from oldest to newest."""
+        start = (self._next - self._count) % self._size
+        for offset in range(self._count):
+            yield (start + offset) % self._size
+
+    def samples(self, since: float = 0) -> list[tuple[float, float]]:
+        """Return samples not older than given timestamp."""
+        return [
+            (self._times[idx], self._values[idx])
+            for idx in self._indexes()
+            if self._times[idx] >= since
+        ]
+
+    def stats(self, since: float) -> tuple[float, float, float] | None:
+        """Return (min, mean, max) of samples not older than given timestamp."""
+        values = [value for _, value in self.samples(since)]
+        if not values:
+            return None
+        return min(values), sum(values) / len(values), max(values)
+
+
+class FoxPowerSampler:
+    """Sample active power of R1S1 devices into ring buffers."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        device_coordinator: FoxDevicesCoordinator,
+        interval: float,
+        size: int,
+    ) -> None:
+        """Initialize object."""
+        self._hass = hass
+        self._device_coordinator = device_coordinator
+        self.interval = interval
+        self._size = size
+        self.buffers: dict[str, PowerSampleBuffer] = {}
+        self._task: asyncio.Task | None = None
+
+    def buffer(self, mac_addr: str) -> PowerSampleBuffer:
+        """Return sample buffer of device."""
+        if mac_addr not in self.buffers:
+            self.buffers[mac_addr] = PowerSampleBuffer(self._size)
+        return self.buffers[mac_addr]
+
+    @callback
+    def start(self) -> None:
+        """Start sampling."""
+        self._task = self._hass.async_create_background_task(
+            self._async_sample(), "fandffox power sampling"
+        )
+
+    @callback
+    def stop(self) -> None:
+        """Stop sampling."""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    async def _async_sample(self) -> None:
+        """Poll devices and store their active power."""
+        while True:
+            started = time.monotonic()
+            devices = self._device_coordinator.get_sensor_devices()
+            try:
+                # Sampling rate is set by its own option, not by poll plan.
+                await self._device_coordinator.async_fetch_devices(
+                    devices, planned=False
+                )
+            except Exception as err:  # pylint: disable=broad-except
+                _LOGGER.debug("F&F Fox power sampling failed: %s", err)
+            now = time.time()
+            for device in devices:
+                # Skip stale state of devices which did not answer.
+                if self._device_coordinator.get_data_age(device) != 0:
+                    continue
+                value = device.fetch_sensor_value_by_key(POWER_KEY)
+                if value is not None:
+                    self.buffer(device.mac_addr).append(now, float(value))
+            await asyncio.sleep(max(0, self.interval - (time.monotonic() - started)))
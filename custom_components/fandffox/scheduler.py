@@ -0,0 +1,148 @@
+"""Per device request scheduling for F&F Fox devices."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from functools import partial
+import heapq
+import itertools
+import logging
+from typing import Any
+
+import aiohttp
+
+_LOGGER = logging.getLogger(__name__)
+
+# Request priorities, lower value is served first.
+PRIORITY_COMMAND = 0
+PRIORITY_CONFIRM = 1
+PRIORITY_POLL = 2
+PRIORITY_INFO = 3
+# Errors after which device request is retried.
+RETRY_ERRORS = (asyncio.TimeoutError, aiohttp.ClientError, OSError)
+
+
+async def async_call_with_retry(
+    job: Callable[[], Awaitable[Any]], timeout: float, retries: int
+) -> Any:
+    """Call device with timeout of each attempt and retry budget."""
+    for attempt in range(retries + 1):
+        try:
+            async with asyncio.timeout(timeout):
+                return await job()
+        except RETRY_ERRORS as err:
+            if attempt >= retries:
+                raise
+            _LOGGER.debug("F&F Fox request failed (%s), retrying.", repr(err))
+
+
+class FoxDeviceQueue:
+    """Send requests to a single device one by one, most important first.
+
+    Queued routine polls of the same job are merged into one and dropped
+    when a command arrives, as the command is followed by its own
+    confirmation read.
+    """
+
+    def __init__(self, name: str) -> None:
+        """Initialize object."""
+        self._name = name
+        self._queue: list[tuple[int, int, Callable[[], Awaitable[Any]], asyncio.Future]] = []
+        self._counter = itertools.count()
+        # Queued polls by job key, removed once they start or finish.
+        self._pending_polls: dict[Any, asyncio.Future] = {}
+        self._worker: asyncio.Task | None = None
+
+    @property
+    def busy(self) -> bool:
+        """Return True if queue has requests in progress."""
+        return self._worker is not None
+
+    def submit(
+        self, priority: int, job: Callable[[], Awaitable[Any]], key: Any = None
+    ) -> asyncio.Future:
+        """Queue request and return future with its result.
+
+        Polls are merged only with a queued poll of equal key. Callers of
+        polls get shielded futures, so one caller giving up (e.g. at poll
+        deadline) does not cancel the request of others.
+        """
+        if priority == PRIORITY_POLL and key is not None and key in self._pending_polls:
+            return asyncio.shield(self._pending_polls[key])
+        future = asyncio.get_running_loop().create_future()
+        if priority == PRIORITY_COMMAND:
+            self._drop_polls()
+        elif priority == PRIORITY_POLL and key is not None:
+            self._pending_polls[key] = future
+            future.add_done_callback(partial(self._forget_poll, key))
+        heapq.heappush(self._queue, (priority, next(self._counter), job, future))
+        if self._worker is None:
+            self._worker = asyncio.get_running_loop().create_task(
+                self._async_run(), name=f"fandffox queue {self._name}"
+            )
+        if priority == PRIORITY_POLL:
+            return asyncio.shield(future)
+        return future
+
+    def _forget_poll(self, key: Any, future: asyncio.Future) -> None:
+        """Stop merging polls into started, finished or cancelled poll."""
+        if self._pending_polls.get(key) is future:
+            del self._pending_polls[key]
+
+    async def async_wait_idle(self) -> None:
+        """Drop queued polls and wait until requests in progress finish."""
+        self._drop_polls()
+        while self._worker is not None:
+            try:
+                await asyncio.shield(self._worker)
+            except asyncio.CancelledError:
+                if asyncio.current_task().cancelling():
+                    raise
+                return
+
+    def cancel(self) -> None:
+        """Cancel all queued requests."""
+        for _, _, _, future in self._queue:
+            future.cancel()
+        self._queue.clear()
+        self._pending_polls.clear()
+        if self._worker is not None:
+            self._worker.cancel()
+            self._worker = None
+
+    def _drop_polls(self) -> None:
+        """Drop queued routine polls, resolving them without result."""
+        polls = [item for item in self._queue if item[0] == PRIORITY_POLL]
+        if not polls:
+            return
+        self._queue = [item for item in self._queue if item[0] != PRIORITY_POLL]
+        heapq.heapify(self._queue)
+        for _, _, _, future in polls:
+            if not future.done():
+                future.set_result(None)
+        self._pending_polls.clear()
+
+    async def _async_run(self) -> None:
+        """Process queued requests."""
+        try:
+            while self._queue:
+                _, _, job, future = heapq.heappop(self._queue)
+                for key, pending in list(self._pending_polls.items()):
+                    if pending is future:
+                        del self._pending_polls[key]
+                if future.done():
+                    continue
+                try:
+                    result = await job()
+                except asyncio.CancelledError:
+                    future.cancel()
+                    raise
+                except Exception as err:  # pylint: disable=broad-except
+                    if not future.done():
+                        future.set_exception(err)
+                else:
+                    if not future.done():
+                        future.set_result(result)
+        finally:
+            if self._worker is asyncio.current_task():
+                self._worker = None
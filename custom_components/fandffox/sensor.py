@@ -3,29 +3,59 @@ from __future__ import annotations
 
 from datetime import timedelta
 import logging
+import time
 
 from . import FoxDevicesCoordinator
-from .const import DOMAIN, POOLING_INTERVAL, SCHEMA_INPUT_UPDATE_POOLING
+from .const import (
+    DEFAULT_ENERGY_STATE_INTERVAL,
+    DOMAIN,
+    POOLING_INTERVAL,
+    POWER_SAMPLE_BUFFER_SIZE,
+    SCHEMA_INPUT_ENERGY_STATE_INTERVAL,
+    SCHEMA_INPUT_POWER_SAMPLE_INTERVAL,
+    SCHEMA_INPUT_UPDATE_POOLING,
+)
+from .energy import ENERGY_COUNTERS, FoxEnergyStatistics
+from .entity import FoxEntity
+from .sampling import FoxPowerSampler
 from homeassistant.components.sensor import (
     SensorDeviceClass,
     SensorEntity,
     SensorEntityDescription,
+    SensorStateClass,
 )
 from homeassistant.const import (
+    ATTR_ENTITY_ID,
     UnitOfElectricCurrent,
     UnitOfElectricPotential,
+    UnitOfEnergy,
     UnitOfFrequency,
     UnitOfPower,
 )
+from homeassistant.core import (
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
+from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.typing import StateType
-from homeassistant.helpers.update_coordinator import (
-    CoordinatorEntity,
-    DataUpdateCoordinator,
-)
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+from homeassistant.util import dt as dt_util
+import voluptuous as vol
 
 _LOGGER = logging.getLogger(__name__)
 
+SERVICE_GET_POWER_SAMPLES = "get_power_samples"
+ATTR_DURATION = "duration"
+GET_POWER_SAMPLES_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_ENTITY_ID): cv.entity_ids,
+        vol.Optional(ATTR_DURATION): vol.All(vol.Coerce(float), vol.Range(min=0)),
+    }
+)
+
 FOX_SENSORS: tuple[SensorEntityDescription, ...] = (
     SensorEntityDescription(
         key="voltage",
@@ -50,41 +80,71 @@ FOX_SENSORS: tuple[SensorEntityDescription, ...] = (
         name="Reactive power",
         device_class=None,
         native_unit_of_measurement="var",
+        entity_registry_enabled_default=False,
     ),
     SensorEntityDescription(
         key="frequency",
         name="AC Frequency",
         device_class=None,
         native_unit_of_measurement=UnitOfFrequency.HERTZ,
+        entity_registry_enabled_default=False,
     ),
     SensorEntityDescription(
         key="power_factor",
         name="Power factor",
         device_class=None,
+        entity_registry_enabled_default=False,
     ),
     SensorEntityDescription(
         key="active_energy",
         name="Active energy",
-        device_class=None,
-        native_unit_of_measurement=UnitOfPower.WATT,
+        device_class=SensorDeviceClass.ENERGY,
+        native_unit_of_measurement=UnitOfEnergy.WATT_HOUR,
     ),
     SensorEntityDescription(
         key="reactive_energy",
         name="Reactive energy",
         device_class=None,
-        native_unit_of_measurement="var",
+        native_unit_of_measurement="varh",
+        entity_registry_enabled_default=False,
     ),
     SensorEntityDescription(
         key="active_energy_import",
         name="Active energy import",
-        device_class=None,
-        native_unit_of_measurement=UnitOfPower.WATT,
+        device_class=SensorDeviceClass.ENERGY,
+        native_unit_of_measurement=UnitOfEnergy.WATT_HOUR,
     ),
     SensorEntityDescription(
         key="reactive_energy_import",
         name="Reactive energy import",
         device_class=None,
-        native_unit_of_measurement="var",
+        native_unit_of_measurement="varh",
+        entity_registry_enabled_default=False,
+    ),
+)
+
+# Active power aggregated over polling interval from high rate samples.
+POWER_STATISTIC_SENSORS: tuple[SensorEntityDescription, ...] = (
+    SensorEntityDescription(
+        key="power_active_min",
+        name="Active power min",
+        device_class=SensorDeviceClass.POWER,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfPower.WATT,
+    ),
+    SensorEntityDescription(
+        key="power_active_mean",
+        name="Active power mean",
+        device_class=SensorDeviceClass.POWER,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfPower.WATT,
+    ),
+    SensorEntityDescription(
+        key="power_active_max",
+        name="Active power max",
+        device_class=SensorDeviceClass.POWER,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfPower.WATT,
     ),
 )
 
@@ -116,47 +176,170 @@ async def async_setup_entry(hass, config_entry, async_add_entities):
     )
 
     await coordinator.async_config_entry_first_refresh()
+    energy_state_interval = float(
+        config_entry.options.get(
+            SCHEMA_INPUT_ENERGY_STATE_INTERVAL, DEFAULT_ENERGY_STATE_INTERVAL
+        )
+    )
     for idx, ent in enumerate(coordinator.data):
         # if isinstance(ent, FoxR1S1Device):
         entities += [
-            FoxGenericSensor(coordinator, idx, description)
+            FoxEnergySensor(
+                coordinator, device_coordinator, idx, description, energy_state_interval
+            )
+            if description.key in ENERGY_COUNTERS
+            else FoxGenericSensor(coordinator, device_coordinator, idx, description)
             for description in FOX_SENSORS
         ]
+
+    if coordinator.data and "recorder" in hass.config.components:
+        config_entry.async_on_unload(
+            FoxEnergyStatistics(hass, device_coordinator).start()
+        )
+
+    sample_interval = config_entry.options.get(SCHEMA_INPUT_POWER_SAMPLE_INTERVAL, 0)
+    if sample_interval and coordinator.data:
+        sampler = FoxPowerSampler(
+            hass, device_coordinator, float(sample_interval), POWER_SAMPLE_BUFFER_SIZE
+        )
+        sampler.start()
+        config_entry.async_on_unload(sampler.stop)
+        for idx, ent in enumerate(coordinator.data):
+            entities += [
+                FoxPowerStatisticSensor(
+                    coordinator, device_coordinator, idx, description, sampler
+                )
+                for description in POWER_STATISTIC_SENSORS
+            ]
+
+        async def async_get_power_samples(call: ServiceCall) -> ServiceResponse:
+            """Return raw power samples of R1S1 devices."""
+            by_entity_id = {entity.entity_id: entity for entity in entities}
+            since = 0.0
+            if ATTR_DURATION in call.data:
+                since = time.time() - call.data[ATTR_DURATION]
+            response = {}
+            for entity_id in call.data[ATTR_ENTITY_ID]:
+                if entity_id not in by_entity_id:
+                    continue
+                buffer = sampler.buffer(by_entity_id[entity_id].device.mac_addr)
+                response[entity_id] = {
+                    "interval": sampler.interval,
+                    "samples": [
+                        [dt_util.utc_from_timestamp(timestamp).isoformat(), value]
+                        for timestamp, value in buffer.samples(since)
+                    ],
+                }
+            return response
+
+        hass.services.async_register(
+            DOMAIN,
+            SERVICE_GET_POWER_SAMPLES,
+            async_get_power_samples,
+            schema=GET_POWER_SAMPLES_SCHEMA,
+            supports_response=SupportsResponse.ONLY,
+        )
+        config_entry.async_on_unload(
+            lambda: hass.services.async_remove(DOMAIN, SERVICE_GET_POWER_SAMPLES)
+        )
+
     async_add_entities(entities)
     return True
 
 
-class FoxGenericSensor(CoordinatorEntity, SensorEntity):
+class FoxGenericSensor(FoxEntity, SensorEntity):
     """Fox generic sensor implementation."""
 
-    def __init__(self, coordinator, idx: int, description: SensorEntityDescription):
+    def __init__(
+        self,
+        coordinator,
+        device_coordinator,
+        idx: int,
+        description: SensorEntityDescription,
+    ):
         """Initialize object."""
-        super().__init__(coordinator)
-        self._idx = idx
         self.entity_description = description
+        super().__init__(coordinator, device_coordinator, idx)
         self._attr_entity_category = EntityCategory.DIAGNOSTIC
+        device = coordinator.data[idx]
+        self._attr_unique_id = f"{device.mac_addr}-sensor-{description.key}"
 
-    @property
-    def name(self):
-        """Return the name of the device."""
-        device = self.coordinator.data[self._idx]
+    def _static_name(self, device) -> str:
+        """Return sensor name of device."""
         name = device.name if not device.name else "r1s1"
         return f"{name}-{device.mac_addr}-sensor-{self.entity_description.key}"
 
-    @property
-    def unique_id(self) -> str:
-        """Return a unique ID."""
-        device = self.coordinator.data[self._idx]
-        return f"{device.mac_addr}-sensor-{self.entity_description.key}"
-
-    @property
-    def device_info(self):
-        """Return device info."""
-        return self.coordinator.data[self._idx].get_device_info()
-
     @property
     def native_value(self) -> StateType:
         """Return the value reported by the sensor."""
         return self.coordinator.data[self._idx].fetch_sensor_value_by_key(
             self.entity_description.key
         )
+
+
+class FoxPowerStatisticSensor(FoxGenericSensor):
+    """Active power min, mean or max over the last polling interval."""
+
+    _STATISTICS = ("power_active_min", "power_active_mean", "power_active_max")
+
+    def __init__(
+        self,
+        coordinator,
+        device_coordinator,
+        idx: int,
+        description: SensorEntityDescription,
+        sampler: FoxPowerSampler,
+    ):
+        """Initialize object."""
+        super().__init__(coordinator, device_coordinator, idx, description)
+        self._sampler = sampler
+        self._attr_entity_category = None
+        self._statistic = self._STATISTICS.index(description.key)
+
+    @property
+    def native_value(self) -> StateType:
+        """Return statistic of samples taken within polling interval."""
+        window = self.coordinator.update_interval.total_seconds()
+        stats = self._sampler.buffer(self.coordinator.data[self._idx].mac_addr).stats(
+            time.time() - window
+        )
+        if stats is None:
+            return None
+        return round(stats[self._statistic], 2)
+
+
+class FoxEnergySensor(FoxGenericSensor):
+    """Energy counter with low rate state writes.
+
+    History of the counter is imported hourly as external statistics, so
+    its state does not have to be written on every poll.
+    """
+
+    def __init__(
+        self,
+        coordinator,
+        device_coordinator,
+        idx: int,
+        description: SensorEntityDescription,
+        state_interval: float,
+    ):
+        """Initialize object."""
+        super().__init__(coordinator, device_coordinator, idx, description)
+        self._state_interval = state_interval
+        self._last_write = 0.0
+        self._last_available: bool | None = None
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state when interval passed or availability changed."""
+        now = time.monotonic()
+        available = self.available
+        if (
+            self._last_write
+            and available == self._last_available
+            and now - self._last_write < self._state_interval
+        ):
+            return
+        self._last_write = now
+        self._last_available = available
+        super()._handle_coordinator_update()
@@ -0,0 +1,64 @@
+"""Snapshot of all F&F Fox devices for fleet views."""
+from __future__ import annotations
+
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.components import websocket_api
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
+
+from .const import DOMAIN
+
+SERVICE_SNAPSHOT = "snapshot"
+WS_TYPE_SNAPSHOT = f"{DOMAIN}/snapshot"
+
+
+@callback
+def async_get_snapshot(hass: HomeAssistant) -> dict[str, Any]:
+    """Return snapshot of devices of all loaded config entries."""
+    return {
+        "devices": [
+            device
+            for coordinator in hass.data.get(DOMAIN, {}).values()
+            for device in coordinator.get_snapshot()
+        ]
+    }
+
+
+@websocket_api.websocket_command({vol.Required("type"): WS_TYPE_SNAPSHOT})
+@callback
+def websocket_snapshot(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Send snapshot of all devices."""
+    connection.send_result(msg["id"], async_get_snapshot(hass))
+
+
+@callback
+def async_register_snapshot_api(hass: HomeAssistant) -> None:
+    """Register snapshot websocket command and service."""
+    if hass.services.has_service(DOMAIN, SERVICE_SNAPSHOT):
+        return
+    websocket_api.async_register_command(hass, websocket_snapshot)
+
+    @callback
+    def _async_snapshot(call: ServiceCall) -> ServiceResponse:
+        """Return snapshot of all devices."""
+        return async_get_snapshot(hass)
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SNAPSHOT,
+        _async_snapshot,
+        schema=vol.Schema({}),
+        supports_response=SupportsResponse.ONLY,
+    )
@@ -2,16 +2,13 @@
 from datetime import timedelta
 import logging
 
-from foxrestapiclient.devices.fox_r1s1_device import FoxR1S1Device
-from foxrestapiclient.devices.fox_r2s2_device import FoxR2S2Device
+from foxrestapiclient.devices.const import DEVICE_MODEL_R1S1, DEVICE_MODEL_R2S2
 
 from . import FoxDevicesCoordinator
 from .const import DOMAIN, POOLING_INTERVAL, SCHEMA_INPUT_UPDATE_POOLING
+from .entity import FoxEntity
 from homeassistant.components.switch import SwitchEntity
-from homeassistant.helpers.update_coordinator import (
-    CoordinatorEntity,
-    DataUpdateCoordinator,
-)
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -47,55 +44,40 @@ async def async_setup_entry(hass, config_entry, async_add_entities):
 
     await coordinator.async_config_entry_first_refresh()
     for idx, ent in enumerate(coordinator.data):
-        if isinstance(ent, FoxR2S2Device):
+        model = device_coordinator.get_device_model(ent)
+        if model == DEVICE_MODEL_R2S2:
             for channel in ent.channels:
-                entities.append(FoxBaseSwitch(coordinator, idx, channel))
-        if isinstance(ent, FoxR1S1Device):
-            entities.append(FoxBaseSwitch(coordinator, idx))
+                entities.append(
+                    FoxBaseSwitch(coordinator, device_coordinator, idx, channel)
+                )
+        if model == DEVICE_MODEL_R1S1:
+            entities.append(FoxBaseSwitch(coordinator, device_coordinator, idx))
 
     async_add_entities(entities)
     return True
 
 
-class FoxBaseSwitch(CoordinatorEntity, SwitchEntity):
+class FoxBaseSwitch(FoxEntity, SwitchEntity):
     """Fox base switch implementation."""
 
-    def __init__(self, coordinator, idx: int, channel: int = None):
+    def __init__(self, coordinator, device_coordinator, idx: int, channel: int = None):
         """Initialize object."""
-        super().__init__(coordinator)
-        self._idx = idx
         self._channel = channel
+        super().__init__(coordinator, device_coordinator, idx)
+        device = coordinator.data[idx]
+        self._attr_unique_id = f"{device.mac_addr}-{device.device_platform}-{channel}"
 
-    @property
-    def name(self):
-        """Return the name of the device."""
-        return (
-            self.coordinator.data[self._idx].name
-            if self._channel is None
-            else self.coordinator.data[self._idx].get_channel_name(self._channel)
-        )
+    def _static_name(self, device) -> str:
+        """Return name of device channel."""
+        if self._channel is None:
+            return device.name
+        return device.get_channel_name(self._channel)
 
     @property
     def is_on(self):
         """Return the is on property."""
         return self.coordinator.data[self._idx].is_on(self._channel)
 
-    @property
-    def available(self):
-        """Return device availability."""
-        return self.coordinator.data[self._idx].is_available
-
-    @property
-    def unique_id(self) -> str:
-        """Return a unique ID."""
-        device = self.coordinator.data[self._idx]
-        return f"{device.mac_addr}-{device.device_platform}-{self._channel}"
-
-    @property
-    def device_info(self):
-        """Return device info data."""
-        return self.coordinator.data[self._idx].get_device_info()
-
     @property
     def should_poll(self):
         """Return the polling state. Polling is needed."""
@@ -104,15 +86,13 @@ class FoxBaseSwitch(CoordinatorEntity, SwitchEntity):
     async def async_turn_on(self, **kwargs) -> None:
         """Turn on the device."""
         if self.coordinator.data[self._idx].is_on(self._channel) is False:
-            await self.coordinator.data[self._idx].async_update_channel_state(
-                True, self._channel
-            )
-        await self.coordinator.async_request_refresh()
+            await self._async_deliver_channel_state(True)
+            return
+        await self._async_confirm()
 
     async def async_turn_off(self, **kwargs) -> None:
         """Turn off the device."""
         if self.coordinator.data[self._idx].is_on(self._channel) is True:
-            await self.coordinator.data[self._idx].async_update_channel_state(
-                False, self._channel
-            )
-        await self.coordinator.async_request_refresh()
+            await self._async_deliver_channel_state(False)
+            return
+        await self._async_confirm()
@@ -0,0 +1,144 @@
+"""Tracking of watched F&F Fox entities for viewer-aware polling."""
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+from itertools import count
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.components import websocket_api
+from homeassistant.components.automation import automations_with_entity
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers import config_validation as cv, entity_registry as er
+from homeassistant.helpers.start import async_at_started
+
+from .const import DOMAIN
+
+DATA_WATCHERS = f"{DOMAIN}_watchers"
+WS_TYPE_WATCH = f"{DOMAIN}/watch"
+# Fired by automation integration after automations were (re)loaded.
+EVENT_AUTOMATION_RELOADED = "automation_reloaded"
+
+
+class FoxWatchers:
+    """Collect entities watched by frontend subscriptions and automations."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize object."""
+        self._hass = hass
+        self._counter = count()
+        self._subscriptions: dict[int, set[str]] = {}
+        self._automation_entities: set[str] = set()
+        self._unsubs: list[Callable[[], None]] = []
+
+    @callback
+    def start(self) -> None:
+        """Start tracking entities used by automations."""
+        self._unsubs.append(
+            self._hass.bus.async_listen(
+                EVENT_AUTOMATION_RELOADED, self._async_update_automations
+            )
+        )
+        # Automations are loaded after integrations at startup.
+        self._unsubs.append(
+            async_at_started(self._hass, self._async_update_automations)
+        )
+
+    @callback
+    def stop(self) -> None:
+        """Stop tracking."""
+        while self._unsubs:
+            self._unsubs.pop()()
+
+    @callback
+    def async_subscribe(self, entity_ids: Iterable[str]) -> Callable[[], None]:
+        """Watch entities until returned callback is called."""
+        key = next(self._counter)
+        self._subscriptions[key] = set(entity_ids)
+        self.async_update()
+
+        @callback
+        def _async_unsubscribe() -> None:
+            """Stop watching entities."""
+            self._subscriptions.pop(key, None)
+            self.async_update()
+
+        return _async_unsubscribe
+
+    @callback
+    def _async_update_automations(self, _arg: Event | HomeAssistant | None = None) -> None:
+        """Find entities referenced by automations."""
+        if "automation" in self._hass.config.components:
+            registry = er.async_get(self._hass)
+            self._automation_entities = {
+                entity.entity_id
+                for entity in registry.entities.values()
+                if entity.platform == DOMAIN
+                and automations_with_entity(self._hass, entity.entity_id)
+            }
+        self.async_update()
+
+    @callback
+    def async_update(self) -> None:
+        """Set watched devices of all coordinators."""
+        registry = er.async_get(self._hass)
+        unique_ids = []
+        for entity_id in self._automation_entities.union(*self._subscriptions.values()):
+            entity = registry.async_get(entity_id)
+            if entity is not None and entity.platform == DOMAIN:
+                unique_ids.append(entity.unique_id)
+        for coordinator in self._hass.data.get(DOMAIN, {}).values():
+            coordinator.set_watched_devices(
+                {
+                    device.mac_addr
+                    for device in coordinator.get_all_devices()
+                    # Unique ids of all platforms start with device MAC address.
+                    if any(
+                        unique_id.startswith(f"{device.mac_addr}-")
+                        for unique_id in unique_ids
+                    )
+                }
+            )
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): WS_TYPE_WATCH,
+        vol.Required("entity_ids"): vol.All(cv.ensure_list, [cv.entity_id]),
+    }
+)
+@callback
+def websocket_watch(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Poll devices of entities at full rate while subscription is open."""
+    watchers: FoxWatchers | None = hass.data.get(DATA_WATCHERS)
+    if watchers is None:
+        connection.send_error(
+            msg["id"], websocket_api.ERR_NOT_FOUND, "No F&F Fox devices loaded"
+        )
+        return
+    connection.subscriptions[msg["id"]] = watchers.async_subscribe(msg["entity_ids"])
+    connection.send_result(msg["id"])
+
+
+@callback
+def async_setup_watchers(hass: HomeAssistant) -> FoxWatchers:
+    """Return watchers, starting them and registering websocket command once."""
+    watchers = hass.data.get(DATA_WATCHERS)
+    if watchers is None:
+        websocket_api.async_register_command(hass, websocket_watch)
+        watchers = hass.data[DATA_WATCHERS] = FoxWatchers(hass)
+        watchers.start()
+    return watchers
+
+
+@callback
+def async_remove_watchers(hass: HomeAssistant) -> None:
+    """Stop watchers."""
+    watchers = hass.data.pop(DATA_WATCHERS, None)
+    if watchers is not None:
+        watchers.stop()
@@ -0,0 +1,106 @@
+"""Watchdog of event loop stalls caused by F&F Fox integration."""
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable, Generator, Iterator
+from contextlib import contextmanager
+import logging
+import time
+import types
+from typing import Any
+
+_LOGGER = logging.getLogger(__name__)
+
+# Timed synchronous sections.
+SECTION_DEVICE_REQUEST = "device_request"
+SECTION_COORDINATOR_UPDATE = "coordinator_update"
+SECTION_STATE_WRITE = "state_write"
+
+
+class FoxStallWatchdog:
+    """Time synchronous sections run in event loop and count slow ones."""
+
+    def __init__(self, threshold: float) -> None:
+        """Initialize object, threshold in seconds, 0 disables watchdog."""
+        self.threshold = threshold
+        self._stats: dict[str, dict[str, float]] = {}
+
+    @property
+    def enabled(self) -> bool:
+        """Return True if sections are timed."""
+        return self.threshold > 0
+
+    def record(self, section: str, detail: str, elapsed: float) -> None:
+        """Record time of section run."""
+        stats = self._stats.setdefault(
+            section, {"runs": 0, "exceeded": 0, "max": 0.0, "excess": 0.0}
+        )
+        stats["runs"] += 1
+        stats["max"] = max(stats["max"], elapsed)
+        if elapsed < self.threshold:
+            return
+        stats["exceeded"] += 1
+        stats["excess"] += elapsed - self.threshold
+        _LOGGER.warning(
+            "F&F Fox %s of %s blocked event loop for %.0f ms",
+            section.replace("_", " "),
+            detail,
+            elapsed * 1000,
+        )
+
+    @contextmanager
+    def measure(self, section: str, detail: str) -> Iterator[None]:
+        """Time synchronous block."""
+        if not self.enabled:
+            yield
+            return
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(section, detail, time.perf_counter() - started)
+
+    @types.coroutine
+    def async_measure_steps(
+        self, section: str, detail: str, job: Callable[[], Awaitable[Any]]
+    ) -> Generator[Any, Any, Any]:
+        """Await job, timing each of its steps run between suspensions."""
+        coro = job().__await__()
+        value: Any = None
+        error: BaseException | None = None
+        while True:
+            started = time.perf_counter()
+            try:
+                if error is None:
+                    suspended = coro.send(value)
+                else:
+                    suspended = coro.throw(error)
+            except StopIteration as stop:
+                self.record(section, detail, time.perf_counter() - started)
+                return stop.value
+            except BaseException:
+                self.record(section, detail, time.perf_counter() - started)
+                raise
+            self.record(section, detail, time.perf_counter() - started)
+            value, error = None, None
+            try:
+                value = yield suspended
+            except GeneratorExit:
+                coro.close()
+                raise
+            except BaseException as err:  # pylint: disable=broad-except
+                error = err
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return watchdog statistics, times in milliseconds."""
+        return {
+            "threshold_ms": round(self.threshold * 1000),
+            "sections": {
+                section: {
+                    "runs": int(stats["runs"]),
+                    "exceeded": int(stats["exceeded"]),
+                    "max_ms": round(stats["max"] * 1000, 1),
+                    "excess_ms": round(stats["excess"] * 1000, 1),
+                }
+                for section, stats in self._stats.items()
+            },
+        }
@@ -0,0 +1 @@
+"""Tests for F&F Fox integration."""
@@ -0,0 +1,186 @@
+"""Soak test of F&F Fox coordinator polling a simulated fleet.
+
+Simulated hours of polls, commands and devices dropping out run in
+accelerated time. The test fails when integration memory or asyncio tasks
+keep growing.
+"""
+from __future__ import annotations
+
+import asyncio
+import gc
+import random
+import tracemalloc
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("homeassistant")
+pytest.importorskip("foxrestapiclient")
+
+# pylint: disable=wrong-import-position
+from foxrestapiclient.devices.const import (  # noqa: E402
+    DEVICE_PLATFORM,
+    SUPPORTED_PLATFORM_SWITCH,
+)
+from foxrestapiclient.devices.fox_base_device import DeviceData  # noqa: E402
+
+from custom_components import fandffox  # noqa: E402
+
+# Number of simulated devices.
+FLEET_SIZE = 20
+# Simulated time (in seconds) between poll cycles.
+POLL_INTERVAL = 5
+# Cycles run before measuring, so caches and queues settle.
+WARMUP_CYCLES = 300
+# Cycles run after measuring starts, 3000 cycles are about 4 simulated hours.
+SOAK_CYCLES = 3000
+# Chance of device dropping out or returning in one cycle.
+FLAP_CHANCE = 0.005
+# Allowed growth of integration memory over soak (in bytes).
+MEMORY_GROWTH_LIMIT = 128 * 1024
+# Traced files of integration.
+TRACE_FILTERS = (tracemalloc.Filter(True, "*fandffox*"),)
+
+
+class FakeClock:
+    """Monotonic clock moved forward by test."""
+
+    def __init__(self) -> None:
+        """Initialize object."""
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        """Return current time."""
+        return self.now
+
+
+class FakeDevice:
+    """Two channel switch answering without network."""
+
+    device_platform = SUPPORTED_PLATFORM_SWITCH
+
+    def __init__(self, device_data: DeviceData) -> None:
+        """Initialize object."""
+        self.name = device_data.name
+        self.host = device_data.host
+        self.mac_addr = device_data.mac_addr
+        self.is_available = True
+        self.online = True
+        self.channels = [1, 2]
+        self._states = {1: False, 2: False}
+
+    async def _async_answer(self) -> None:
+        """Answer request, or time out when device is offline."""
+        await asyncio.sleep(0)
+        self.is_available = self.online
+        if not self.online:
+            raise asyncio.TimeoutError
+
+    async def async_fetch_update(self) -> None:
+        """Fetch device state."""
+        await self._async_answer()
+
+    async def async_fetch_device_available_data(self) -> None:
+        """Fetch device info and state."""
+        await self._async_answer()
+
+    async def async_fetch_device_info(self) -> None:
+        """Fetch static device info."""
+        await self._async_answer()
+
+    async def async_update_channel_state(self, state: bool, channel: int) -> None:
+        """Set channel state."""
+        await self._async_answer()
+        self._states[channel] = state
+
+    def is_on(self, channel: int) -> bool:
+        """Return channel state."""
+        return self._states[channel]
+
+    def get_device_info(self) -> dict:
+        """Return device registry info."""
+        return {"identifiers": {(self.device_platform, self.mac_addr)}}
+
+
+def _integration_memory() -> int:
+    """Return size of memory allocated by integration (in bytes)."""
+    gc.collect()
+    snapshot = tracemalloc.take_snapshot().filter_traces(TRACE_FILTERS)
+    return sum(stat.size for stat in snapshot.statistics("filename"))
+
+
+async def _async_soak(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Run simulated fleet and check growth after warm up."""
+    clock = FakeClock()
+    monkeypatch.setattr(fandffox, "time", SimpleNamespace(monotonic=clock))
+    monkeypatch.setattr(fandffox, "get_device_class", lambda model: FakeDevice)
+    monkeypatch.setattr(fandffox, "CHANNEL_BATCH_WINDOW", 0)
+    dev_type = next(
+        dev_type
+        for dev_type, platform in DEVICE_PLATFORM.items()
+        if platform == SUPPORTED_PLATFORM_SWITCH
+    )
+    coordinator = fandffox.FoxDevicesCoordinator({})
+    for idx in range(FLEET_SIZE):
+        coordinator.add_device_by_config(
+            DeviceData(
+                f"Fake {idx}",
+                f"192.0.2.{idx + 1}",
+                "000",
+                f"00:00:5e:00:53:{idx:02x}",
+                dev_type,
+            )
+        )
+    devices = coordinator.get_all_devices()
+    by_host = {device.host: device for device in devices}
+
+    async def _async_probe_host(host: str, port: int, timeout: float) -> bool:
+        """Probe simulated device."""
+        await asyncio.sleep(0)
+        return by_host[host].online
+
+    monkeypatch.setattr(fandffox, "async_probe_host", _async_probe_host)
+    rng = random.Random(0)
+
+    async def _async_run_cycles(cycles: int) -> None:
+        """Run poll cycles with one command each."""
+        for cycle in range(cycles):
+            clock.now += POLL_INTERVAL
+            for device in devices:
+                if rng.random() < FLAP_CHANCE:
+                    device.online = not device.online
+            await coordinator.async_fetch_devices(devices)
+            if rng.random() < 0.1:
+                await coordinator.async_probe_unreachable()
+            device = rng.choice(devices)
+            try:
+                await coordinator.async_set_channel_state(
+                    device, rng.choice(device.channels), rng.random() < 0.5
+                )
+            except asyncio.TimeoutError:
+                pass
+            if cycle % 50 == 0:
+                coordinator.get_snapshot()
+
+    try:
+        await _async_run_cycles(WARMUP_CYCLES)
+        memory = _integration_memory()
+        tasks = len(asyncio.all_tasks())
+        await _async_run_cycles(SOAK_CYCLES)
+        memory_growth = _integration_memory() - memory
+        task_growth = len(asyncio.all_tasks()) - tasks
+    finally:
+        coordinator.shutdown()
+
+    assert memory_growth < MEMORY_GROWTH_LIMIT, f"memory grew by {memory_growth} B"
+    # Revalidation and info refresh tasks may be in flight for any device.
+    assert task_growth <= FLEET_SIZE, f"asyncio tasks grew by {task_growth}"
+
+
+def test_fleet_soak(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Soak coordinator with simulated fleet, failing on leaks."""
+    tracemalloc.start()
+    try:
+        asyncio.run(_async_soak(monkeypatch))
+    finally:
+        tracemalloc.stop()